@@ -2,6 +2,7 @@
 
 import logging
 import asyncio
+from collections import deque
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -10,14 +11,13 @@ from telegram.ext import (
     filters,
     ContextTypes,
 )
+from telegram.request import HTTPXRequest
 
 from config import get_config
-from services.database import DatabaseService
-from services.llm import LLMService, Intent
-from services.places import PlacesService
-from handlers.log_entry import handle_log_entry, handle_add_details, get_order_conversation_handler
-from handlers.what_to_eat import get_what_to_eat_handler, start_what_to_eat
-from handlers.query import handle_query, handle_search_command
+
+# Service and handler modules (and their anthropic/aiosqlite/httpx
+# dependencies) are imported lazily inside the functions that need them,
+# keeping process start and restart fast.
 
 # Configure logging
 logging.basicConfig(
@@ -63,31 +63,59 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
 
 
+def _history_to_dicts(history) -> list[dict]:
+    """Expand compact (role, content) history tuples to LLM message dicts."""
+    return [
+        {"role": "user" if role == "u" else "assistant", "content": content}
+        for role, content in history
+    ]
+
+
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Route messages based on LLM intent analysis."""
-    config = context.bot_data["config"]
-    llm: LLMService = context.bot_data["llm"]
+    # Cheap after the first call: these resolve through sys.modules
+    from services.llm import Intent
+    from handlers.log_entry import handle_log_entry, handle_add_details
+    from handlers.what_to_eat import start_what_to_eat
+    from handlers.query import handle_query
 
-    # Check if chat is allowed
-    chat_id = update.effective_chat.id
-    if not config.is_chat_allowed(chat_id):
-        logger.warning(f"Message from unauthorized chat: {chat_id}")
-        return
+    llm = context.bot_data["llm"]
+
+    # Chat authorization is enforced by the filters.Chat registration in
+    # main(), before this handler is ever scheduled
 
     text = update.message.text
     if not text:
         return
 
-    # Get conversation context
-    messages = context.chat_data.get("messages", [])
+    # Conversation context lives in a bounded deque of compact
+    # (role, content) tuples - "u"/"a" instead of per-message dicts -
+    # and appends evict the oldest turn automatically
+    messages = context.chat_data.get("messages")
+    if not isinstance(messages, deque):
+        # Fresh chat, or history stored in the older dict format
+        messages = deque(
+            (
+                ("u" if m["role"] == "user" else "a", m["content"])
+                if isinstance(m, dict) else m
+                for m in (messages or [])
+            ),
+            maxlen=10,
+        )
+        context.chat_data["messages"] = messages
+
+    # With concurrent update dispatch, two handlers in the same chat can
+    # interleave - serialize history mutations per chat
+    history_lock = context.chat_data.setdefault("history_lock", asyncio.Lock())
 
     # Add current message to context
-    messages.append({"role": "user", "content": text})
-    # Keep last 10 messages
-    context.chat_data["messages"] = messages[-10:]
+    async with history_lock:
+        messages.append(("u", text))
+        history_snapshot = _history_to_dicts(messages)
 
-    # Analyze the message
-    analysis = await llm.analyze_message(text, messages)
+    # Near-duplicate phrasings are answered from LLMService's semantic
+    # cache without a Claude round-trip
+    analysis = await llm.analyze_message(text, history_snapshot)
     logger.info(f"Intent: {analysis.intent} (confidence: {analysis.confidence})")
 
     # Handle low confidence
@@ -105,11 +133,14 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     elif analysis.intent == Intent.ADD_DETAILS and analysis.details:
         response = await handle_add_details(update, context, analysis.details)
 
-    elif analysis.intent == Intent.QUERY_RESTAURANT and analysis.query:
-        response = await handle_query(update, context, analysis.query)
-
-    elif analysis.intent == Intent.QUERY_GENERAL and analysis.query:
+    elif analysis.intent in (Intent.QUERY_RESTAURANT, Intent.QUERY_GENERAL) and analysis.query:
+        # handle_query streams its reply into its own message; only the
+        # final text comes back, for history
         response = await handle_query(update, context, analysis.query)
+        if response:
+            async with history_lock:
+                messages.append(("a", response))
+        return
 
     elif analysis.intent == Intent.WHAT_TO_EAT:
         # Start the what to eat flow
@@ -134,14 +165,18 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     if response:
         # Store bot response in context
-        messages.append({"role": "assistant", "content": response})
-        context.chat_data["messages"] = messages[-10:]
+        async with history_lock:
+            messages.append(("a", response))
 
         await update.message.reply_text(response, parse_mode="Markdown")
 
 
 async def post_init(application: Application) -> None:
     """Initialize services after bot is created."""
+    from services.database import DatabaseService
+    from services.llm import LLMService
+    from services.places import PlacesService
+
     config = get_config()
 
     # Initialize database
@@ -166,17 +201,31 @@ async def post_shutdown(application: Application) -> None:
     db = application.bot_data.get("db")
     if db:
         await db.close()
+    llm = application.bot_data.get("llm")
+    if llm:
+        await llm.close()
+    places = application.bot_data.get("places")
+    if places:
+        await places.aclose()
     logger.info("Bot shutdown complete")
 
 
 def main() -> None:
     """Start the bot."""
+    from handlers.log_entry import get_order_conversation_handler
+    from handlers.what_to_eat import get_what_to_eat_handler
+    from handlers.query import handle_search_command
+
     config = get_config()
 
-    # Create application
+    # Create application with concurrent dispatch and pooled HTTP
+    # connections, so bursty chats overlap instead of serializing sends
     application = (
         Application.builder()
         .token(config.telegram_bot_token)
+        .concurrent_updates(True)
+        .get_updates_request(HTTPXRequest(connection_pool_size=32, pool_timeout=5))
+        .request(HTTPXRequest(connection_pool_size=64))
         .post_init(post_init)
         .post_shutdown(post_shutdown)
         .build()
@@ -191,9 +240,18 @@ def main() -> None:
     application.add_handler(get_order_conversation_handler())
     application.add_handler(get_what_to_eat_handler())
 
-    # Add general message handler
+    # Drop messages from unauthorized chats in PTB's filter layer, before
+    # a handler coroutine is ever scheduled
+    allowed_chats = (
+        filters.Chat(chat_id=config.allowed_chat_ids)
+        if config.allowed_chat_ids
+        else filters.ALL
+    )
+
+    # Add general message handler (non-blocking so slow LLM turns don't
+    # stall dispatch of other updates)
     application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message)
+        MessageHandler(filters.TEXT & ~filters.COMMAND & allowed_chats, handle_message, block=False)
     )
 
     # Start the bot
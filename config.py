@@ -2,28 +2,38 @@
 
 import os
 from dataclasses import dataclass, field
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration loaded from environment variables."""
+    """Application configuration loaded from environment variables.
+
+    Frozen with slots: attribute reads skip the instance __dict__, and the
+    config can't be mutated after validation.
+    """
 
     telegram_bot_token: str = field(default_factory=lambda: os.getenv("TELEGRAM_BOT_TOKEN", ""))
     anthropic_api_key: str = field(default_factory=lambda: os.getenv("ANTHROPIC_API_KEY", ""))
     google_places_api_key: str = field(default_factory=lambda: os.getenv("GOOGLE_PLACES_API_KEY", ""))
 
-    allowed_chat_ids: list[int] = field(default_factory=list)
+    allowed_chat_ids: frozenset[int] = field(default_factory=frozenset)
     default_location_bias: str = field(default_factory=lambda: os.getenv("DEFAULT_LOCATION_BIAS", "Orange County, CA"))
     database_path: str = field(default_factory=lambda: os.getenv("DATABASE_PATH", "foodmemory.db"))
 
     def __post_init__(self):
-        # Parse allowed chat IDs from comma-separated string
+        # Parse allowed chat IDs from comma-separated string; frozenset
+        # gives O(1) membership checks on the per-message hot path
         chat_ids_str = os.getenv("ALLOWED_CHAT_IDS", "")
         if chat_ids_str:
-            self.allowed_chat_ids = [int(id.strip()) for id in chat_ids_str.split(",") if id.strip()]
+            object.__setattr__(
+                self,
+                "allowed_chat_ids",
+                frozenset(int(id.strip()) for id in chat_ids_str.split(",") if id.strip()),
+            )
 
         # Validate required fields
         if not self.telegram_bot_token:
@@ -40,6 +50,12 @@ class Config:
         return chat_id in self.allowed_chat_ids
 
 
+_CONFIG: Optional[Config] = None
+
+
 def get_config() -> Config:
-    """Get application configuration."""
-    return Config()
+    """Get the application configuration, parsed and validated once."""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = Config()
+    return _CONFIG
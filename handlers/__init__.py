@@ -1,7 +1,24 @@
-"""Telegram bot handlers."""
+"""Telegram bot handlers.
 
-from .log_entry import handle_log_entry, get_order_conversation_handler
-from .what_to_eat import get_what_to_eat_handler
-from .query import handle_query
+Re-exports are resolved lazily (PEP 562) so importing the package doesn't
+pull in every handler module - and transitively the anthropic/httpx
+stacks - before they're actually needed.
+"""
+
+from importlib import import_module
 
 __all__ = ["handle_log_entry", "get_order_conversation_handler", "get_what_to_eat_handler", "handle_query"]
+
+_EXPORTS = {
+    "handle_log_entry": "log_entry",
+    "get_order_conversation_handler": "log_entry",
+    "get_what_to_eat_handler": "what_to_eat",
+    "handle_query": "query",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
@@ -1,11 +1,14 @@
 """Handler for logging food entries."""
 
+import asyncio
 import logging
+import re
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, ConversationHandler, CallbackQueryHandler, MessageHandler, filters
 
 from services.llm import ParsedLogEntry, ParsedDetails
 from services.database import DatabaseService
+from services.fuzzy import ratio
 from services.places import PlacesService
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,21 @@ WAITING_FOR_ORDER = 0
 ADD_ORDER_YES = "add_order_yes"
 ADD_ORDER_NO = "add_order_no"
 
+# Immutable per-call objects, built once at import
+_ORDER_PATTERN = re.compile(f"^({ADD_ORDER_YES}|{ADD_ORDER_NO})$")
+_ORDER_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Yes", callback_data=ADD_ORDER_YES),
+        InlineKeyboardButton("No thanks", callback_data=ADD_ORDER_NO),
+    ]
+])
+_SENTIMENT_EMOJI = {
+    "positive": "👍",
+    "negative": "👎",
+    "neutral": "😐",
+    "mixed": "🤔",
+}
+
 
 async def handle_log_entry(
     update: Update,
@@ -37,16 +55,25 @@ async def handle_log_entry(
     user_name = user.first_name if user else "Unknown"
     user_telegram_id = user.id if user else None
 
-    # Try to find or create restaurant with enrichment
-    restaurant = await db.find_restaurant_by_name(parsed.restaurant_name)
+    # The restaurant lookup and Places enrichment are independent - start
+    # both up front and cancel the Places call if it turns out the
+    # restaurant is already enriched.
+    restaurant_task = asyncio.create_task(db.find_restaurant_by_name(parsed.restaurant_name))
+    places_task = asyncio.create_task(places.search_restaurant(parsed.restaurant_name))
+
+    restaurant = await restaurant_task
 
-    if not restaurant:
-        # Try to enrich with Google Places
-        place_data = await places.search_restaurant(parsed.restaurant_name)
+    if restaurant and restaurant.google_place_id:
+        # Already enriched - no need for the Places result
+        places_task.cancel()
+    else:
+        place_data = await places_task
+        # Use the canonical stored name when the fuzzy lookup matched
+        name = restaurant.name if restaurant else parsed.restaurant_name
 
         if place_data:
-            restaurant = await db.find_or_create_restaurant(
-                name=parsed.restaurant_name,
+            restaurant = await db.upsert_restaurant(
+                name=name,
                 google_place_id=place_data.place_id,
                 address=place_data.address,
                 latitude=place_data.latitude,
@@ -57,26 +84,9 @@ async def handle_log_entry(
                 takeout=place_data.takeout,
                 delivery=place_data.delivery,
             )
-        else:
+        elif not restaurant:
             # Create without enrichment
-            restaurant = await db.find_or_create_restaurant(name=parsed.restaurant_name)
-    else:
-        # Existing restaurant - try to enrich if missing place_id
-        if not restaurant.google_place_id:
-            place_data = await places.search_restaurant(parsed.restaurant_name)
-            if place_data:
-                restaurant = await db.find_or_create_restaurant(
-                    name=restaurant.name,
-                    google_place_id=place_data.place_id,
-                    address=place_data.address,
-                    latitude=place_data.latitude,
-                    longitude=place_data.longitude,
-                    cuisine=place_data.cuisine,
-                    price_level=place_data.price_level,
-                    dine_in=place_data.dine_in,
-                    takeout=place_data.takeout,
-                    delivery=place_data.delivery,
-                )
+            restaurant = await db.upsert_restaurant(name=name)
 
     # Create the entry
     entry = await db.add_entry(
@@ -98,26 +108,14 @@ async def handle_log_entry(
     dish_part = f" {parsed.dish_name}" if parsed.dish_name else ""
     sentiment_emoji = _get_sentiment_emoji(parsed.sentiment)
 
-    message = f"Got it, {user_name}!{dish_part} at {restaurant.name} {sentiment_emoji}"
-
-    if restaurant.cuisine:
-        message += f" ({restaurant.cuisine})"
-
-    if parsed.tags:
-        message += f"\nTags: {', '.join(parsed.tags)}"
-
-    # Add follow-up question with buttons
-    message += "\n\nWant to save a specific order for next time?"
-
-    keyboard = [
-        [
-            InlineKeyboardButton("Yes", callback_data=ADD_ORDER_YES),
-            InlineKeyboardButton("No thanks", callback_data=ADD_ORDER_NO),
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    message = "".join(filter(None, (
+        f"Got it, {user_name}!{dish_part} at {restaurant.name} {sentiment_emoji}",
+        f" ({restaurant.cuisine})" if restaurant.cuisine else None,
+        f"\nTags: {', '.join(parsed.tags)}" if parsed.tags else None,
+        "\n\nWant to save a specific order for next time?",
+    )))
 
-    await update.message.reply_text(message, reply_markup=reply_markup)
+    await update.message.reply_text(message, reply_markup=_ORDER_KEYBOARD)
 
 
 async def handle_order_callback(
@@ -183,7 +181,7 @@ def get_order_conversation_handler() -> ConversationHandler:
     """Create the ConversationHandler for exact order flow."""
     return ConversationHandler(
         entry_points=[
-            CallbackQueryHandler(handle_order_callback, pattern=f"^({ADD_ORDER_YES}|{ADD_ORDER_NO})$"),
+            CallbackQueryHandler(handle_order_callback, pattern=_ORDER_PATTERN),
         ],
         states={
             WAITING_FOR_ORDER: [
@@ -228,10 +226,11 @@ async def handle_add_details(
 
     # Check if user mentioned a different restaurant
     if parsed.restaurant_name:
-        # Fuzzy match - check if the names are similar
+        # Fuzzy match - substring catches abbreviations ("Siam" for
+        # "Siam Station"), edit-distance ratio catches typos
         mentioned = parsed.restaurant_name.lower().strip()
         last = (last_restaurant or "").lower().strip()
-        if mentioned not in last and last not in mentioned:
+        if mentioned not in last and last not in mentioned and ratio(mentioned, last) < 0.75:
             return (
                 f"Your last entry was at {last_restaurant}, not {parsed.restaurant_name}.\n\n"
                 f"To add something to {parsed.restaurant_name}, try:\n"
@@ -268,9 +267,9 @@ async def handle_add_details(
         updates["sentiment_score"] = parsed.sentiment_score
 
     if parsed.tags:
-        # Merge tags
+        # Merge tags, deduplicating while preserving insertion order
         existing_tags = entry.tags or []
-        updates["tags"] = list(set(existing_tags + parsed.tags))
+        updates["tags"] = list(dict.fromkeys((*existing_tags, *parsed.tags)))
 
     if updates:
         await db.update_entry(last_entry_id, **updates)
@@ -292,9 +291,4 @@ async def handle_add_details(
 
 def _get_sentiment_emoji(sentiment: str) -> str:
     """Get emoji for sentiment."""
-    return {
-        "positive": "👍",
-        "negative": "👎",
-        "neutral": "😐",
-        "mixed": "🤔",
-    }.get(sentiment, "")
+    return _SENTIMENT_EMOJI.get(sentiment, "")
@@ -1,7 +1,9 @@
 """Handler for querying saved food entries."""
 
 import logging
+import time
 from telegram import Update
+from telegram.error import RetryAfter, TelegramError
 from telegram.ext import ContextTypes
 
 from services.llm import ParsedQuery, LLMService
@@ -9,6 +11,63 @@ from services.database import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between in-place edits of a streaming reply; Telegram
+# throttles edits well before the model runs out of tokens
+_STREAM_EDIT_INTERVAL = 0.5
+
+
+async def _stream_answer_reply(
+    update: Update,
+    llm: LLMService,
+    question: str,
+    data_context: str,
+    cache_version: int,
+) -> str:
+    """Stream an LLM answer into a single Telegram message.
+
+    The reply is sent as soon as the first text arrives and then edited
+    in place with the accumulated answer every ~500ms, so the user reads
+    the opening sentence while the rest is still generating. Partial
+    text is sent without parse_mode - half-finished Markdown entities
+    would make Telegram reject the whole edit.
+
+    Returns:
+        The final answer text, for conversation history
+    """
+    message = None
+    sent = ""
+    parts: list[str] = []
+    last_edit = 0.0
+
+    async for chunk in llm.stream_answer(question, data_context, cache_version):
+        parts.append(chunk)
+        now = time.monotonic()
+        if message is None:
+            sent = "".join(parts)
+            message = await update.message.reply_text(sent)
+            last_edit = now
+        elif now - last_edit >= _STREAM_EDIT_INTERVAL:
+            last_edit = now
+            text = "".join(parts)
+            if text != sent:
+                # Interim edits are best-effort: flood control or a
+                # transient error just skips this tick, and the final
+                # edit below still lands the complete answer
+                try:
+                    await message.edit_text(text)
+                    sent = text
+                except RetryAfter as e:
+                    last_edit = now + e.retry_after
+                except TelegramError as e:
+                    logger.warning(f"Interim stream edit failed: {e}")
+
+    answer = "".join(parts)
+    if message is None:
+        await update.message.reply_text(answer or "I'm having trouble looking that up right now.")
+    elif answer != sent:
+        await message.edit_text(answer)
+    return answer
+
 
 async def handle_query(
     update: Update,
@@ -18,6 +77,9 @@ async def handle_query(
 ) -> str:
     """Handle queries about saved entries.
 
+    Sends its own reply, streaming LLM-generated answers into the
+    message as they arrive rather than waiting for the full completion.
+
     Args:
         update: Telegram update
         context: Bot context with services
@@ -25,7 +87,7 @@ async def handle_query(
         original_question: The user's original question text
 
     Returns:
-        Response message with query results
+        The final reply text, for conversation history
     """
     db: DatabaseService = context.bot_data["db"]
     llm: LLMService = context.bot_data["llm"]
@@ -36,7 +98,7 @@ async def handle_query(
 
     # Restaurant-specific query
     if parsed.restaurant_name:
-        return await _query_restaurant(db, llm, parsed.restaurant_name, original_question)
+        return await _query_restaurant(update, db, llm, parsed.restaurant_name, original_question)
 
     # General search
     entries = await db.search_entries(
@@ -48,16 +110,19 @@ async def handle_query(
 
     if not entries:
         query_desc = _describe_query(parsed)
-        return f"I don't have any entries{query_desc} yet. Try logging some experiences first!"
+        response = f"I don't have any entries{query_desc} yet. Try logging some experiences first!"
+        await update.message.reply_text(response)
+        return response
 
     # Format data for LLM
     data_context = _format_entries_for_llm(entries)
 
-    # Get natural language response
-    return await llm.answer_query(original_question, data_context)
+    # Stream the natural language response into the reply
+    return await _stream_answer_reply(update, llm, original_question, data_context, db.version)
 
 
 async def _query_restaurant(
+    update: Update,
     db: DatabaseService,
     llm: LLMService,
     restaurant_name: str,
@@ -67,61 +132,64 @@ async def _query_restaurant(
     restaurant = await db.find_restaurant_by_name(restaurant_name)
 
     if not restaurant:
-        return f"I don't have any records for '{restaurant_name}'. Is the name spelled correctly?"
+        response = f"I don't have any records for '{restaurant_name}'. Is the name spelled correctly?"
+        await update.message.reply_text(response)
+        return response
 
     entries = await db.get_entries_for_restaurant(restaurant.id, limit=15)
 
     if not entries:
-        return f"I found {restaurant.name} in the database, but there are no logged visits yet!"
+        response = f"I found {restaurant.name} in the database, but there are no logged visits yet!"
+        await update.message.reply_text(response)
+        return response
 
-    # Build data context for LLM
-    data_context = f"Restaurant: {restaurant.name}\n"
+    # Build data context for LLM (list-append + join, not repeated +=)
+    parts = [f"Restaurant: {restaurant.name}\n"]
     if restaurant.cuisine:
-        data_context += f"Cuisine: {restaurant.cuisine}\n"
+        parts.append(f"Cuisine: {restaurant.cuisine}\n")
     if restaurant.address:
-        data_context += f"Address: {restaurant.address}\n"
+        parts.append(f"Address: {restaurant.address}\n")
+
+    parts.append(f"\nTotal visits logged: {len(entries)}\n\nEntries:\n")
+
+    parts.extend(_format_entry(entry, include_restaurant=False) for entry in entries)
 
-    data_context += f"\nTotal visits logged: {len(entries)}\n\nEntries:\n"
+    data_context = "".join(parts)
 
-    for entry in entries:
-        data_context += f"\n- Date: {entry.created_at[:10] if entry.created_at else 'Unknown'}\n"
-        data_context += f"  User: {entry.user_name or 'Unknown'}\n"
-        if entry.dish:
-            data_context += f"  Dish: {entry.dish}\n"
-        if entry.exact_order:
-            data_context += f"  Saved order: {entry.exact_order}\n"
-        if entry.sentiment:
-            data_context += f"  Sentiment: {entry.sentiment}\n"
-        if entry.notes:
-            data_context += f"  Notes: {entry.notes}\n"
-        if entry.tags:
-            data_context += f"  Tags: {', '.join(entry.tags)}\n"
+    # Stream the natural language response into the reply
+    return await _stream_answer_reply(update, llm, original_question, data_context, db.version)
 
-    # Get natural language response
-    return await llm.answer_query(original_question, data_context)
+
+def _format_entry(entry, include_restaurant: bool = True) -> str:
+    """Format a single entry as a text block for the LLM."""
+    date = entry.created_at[:10] if entry.created_at else "Unknown"
+    if include_restaurant:
+        lines = [
+            f"- Restaurant: {entry.restaurant_name or 'Unknown'}",
+            f"  Date: {date}",
+        ]
+    else:
+        lines = [f"\n- Date: {date}"]
+    lines.append(f"  User: {entry.user_name or 'Unknown'}")
+
+    if entry.dish:
+        lines.append(f"  Dish: {entry.dish}")
+    if entry.exact_order:
+        lines.append(f"  Saved order: {entry.exact_order}")
+    if entry.sentiment:
+        lines.append(f"  Sentiment: {entry.sentiment}")
+    if entry.notes:
+        lines.append(f"  Notes: {entry.notes}")
+    if entry.tags:
+        lines.append(f"  Tags: {', '.join(entry.tags)}")
+
+    return "\n".join(lines) + "\n"
 
 
 def _format_entries_for_llm(entries: list) -> str:
     """Format entries as context for the LLM."""
-    data_context = f"Total entries found: {len(entries)}\n\n"
-
-    for entry in entries:
-        data_context += f"- Restaurant: {entry.restaurant_name or 'Unknown'}\n"
-        data_context += f"  Date: {entry.created_at[:10] if entry.created_at else 'Unknown'}\n"
-        data_context += f"  User: {entry.user_name or 'Unknown'}\n"
-        if entry.dish:
-            data_context += f"  Dish: {entry.dish}\n"
-        if entry.exact_order:
-            data_context += f"  Saved order: {entry.exact_order}\n"
-        if entry.sentiment:
-            data_context += f"  Sentiment: {entry.sentiment}\n"
-        if entry.notes:
-            data_context += f"  Notes: {entry.notes}\n"
-        if entry.tags:
-            data_context += f"  Tags: {', '.join(entry.tags)}\n"
-        data_context += "\n"
-
-    return data_context
+    header = f"Total entries found: {len(entries)}\n\n"
+    return header + "".join(f"{_format_entry(entry)}\n" for entry in entries)
 
 
 def _describe_query(parsed: ParsedQuery) -> str:
@@ -163,9 +231,7 @@ async def handle_search_command(
         await update.message.reply_text(f"No entries found matching '{search_term}'")
         return
 
-    # Format data and get LLM response
+    # Format data and stream the LLM response into the reply
     data_context = _format_entries_for_llm(entries)
     question = f"What do we have that matches '{search_term}'?"
-    response = await llm.answer_query(question, data_context)
-
-    await update.message.reply_text(response)
+    await _stream_answer_reply(update, llm, question, data_context, db.version)
@@ -1,5 +1,6 @@
 """Handler for 'what to eat' decision flow."""
 
+import asyncio
 import logging
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
@@ -26,6 +27,18 @@ REJECT = "reject"
 CANCEL = "cancel"
 ANY_CUISINE = "any"
 
+# Last-built cuisine keyboard, keyed by the cuisine tuple it was built
+# from - a changed cuisine list naturally invalidates it
+_keyboard_cache: tuple[tuple[str, ...], InlineKeyboardMarkup] | None = None
+
+# Built once at import instead of per lookup
+_SENTIMENT_EMOJI = {
+    "positive": "👍",
+    "negative": "👎",
+    "neutral": "😐",
+    "mixed": "🤔",
+}
+
 
 async def start_what_to_eat(
     update: Update,
@@ -45,10 +58,35 @@ async def start_what_to_eat(
         )
         return ConversationHandler.END
 
+    reply_markup = _cuisine_keyboard(cuisines)
+
+    # Initialize rejected restaurants list
+    context.chat_data["rejected_restaurants"] = []
+
+    await update.message.reply_text(
+        "What kind of food are you in the mood for?",
+        reply_markup=reply_markup,
+    )
+
+    return SELECTING_CUISINE
+
+
+def _cuisine_keyboard(cuisines: list[str]) -> InlineKeyboardMarkup:
+    """Build the cuisine picker keyboard, reusing the last-built markup.
+
+    The cuisine list only changes when a restaurant is written, so most
+    /whattoeat calls skip the button construction entirely.
+    """
+    global _keyboard_cache
+
+    key = tuple(cuisines[:8])  # Limit to 8 cuisines
+    if _keyboard_cache and _keyboard_cache[0] == key:
+        return _keyboard_cache[1]
+
     # Build cuisine buttons (2 per row)
     keyboard = []
     row = []
-    for cuisine in cuisines[:8]:  # Limit to 8 cuisines
+    for cuisine in key:
         row.append(InlineKeyboardButton(cuisine, callback_data=f"{CUISINE_PREFIX}{cuisine}"))
         if len(row) == 2:
             keyboard.append(row)
@@ -64,17 +102,9 @@ async def start_what_to_eat(
         InlineKeyboardButton("❌ Cancel", callback_data=CANCEL),
     ])
 
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
-    # Initialize rejected restaurants list
-    context.chat_data["rejected_restaurants"] = []
-
-    await update.message.reply_text(
-        "What kind of food are you in the mood for?",
-        reply_markup=reply_markup,
-    )
-
-    return SELECTING_CUISINE
+    markup = InlineKeyboardMarkup(keyboard)
+    _keyboard_cache = (key, markup)
+    return markup
 
 
 async def handle_cuisine_selection(
@@ -83,12 +113,19 @@ async def handle_cuisine_selection(
 ) -> int:
     """Handle cuisine selection and suggest a restaurant."""
     query = update.callback_query
-    await query.answer()
+
+    # Answer the callback in the background - both it and the message
+    # edit are Telegram round-trips, so overlapping them halves the
+    # perceived button latency
+    answer_task = asyncio.create_task(query.answer())
 
     data = query.data
 
     if data == CANCEL:
-        await query.edit_message_text("No problem! Let me know when you're ready to eat.")
+        await asyncio.gather(
+            answer_task,
+            query.edit_message_text("No problem! Let me know when you're ready to eat."),
+        )
         return ConversationHandler.END
 
     # Extract cuisine
@@ -98,7 +135,9 @@ async def handle_cuisine_selection(
 
     context.chat_data["selected_cuisine"] = cuisine
 
-    return await suggest_restaurant(update, context)
+    state = await suggest_restaurant(update, context)
+    await answer_task
+    return state
 
 
 async def suggest_restaurant(
@@ -115,6 +154,7 @@ async def suggest_restaurant(
     result = await db.get_random_positive_restaurant(
         cuisine=cuisine,
         exclude_ids=rejected,
+        entry_limit=3,  # The message only ever shows three visits
     )
 
     if not result:
@@ -136,7 +176,7 @@ async def suggest_restaurant(
         message += f"\n📍 {restaurant.address}"
 
     message += "\n\n**Your past visits:**"
-    for entry in entries[:3]:
+    for entry in entries:
         emoji = _get_sentiment_emoji(entry.sentiment)
         dish = entry.dish or "No dish noted"
         user = entry.user_name or "Someone"
@@ -168,24 +208,26 @@ async def handle_confirmation(
 ) -> int:
     """Handle accept/reject of restaurant suggestion."""
     query = update.callback_query
-    await query.answer()
+
+    # Overlap the callback answer with the edit (see handle_cuisine_selection)
+    answer_task = asyncio.create_task(query.answer())
 
     data = query.data
 
     if data == CANCEL:
-        await query.edit_message_text("No problem! Let me know when you're ready to eat.")
+        await asyncio.gather(
+            answer_task,
+            query.edit_message_text("No problem! Let me know when you're ready to eat."),
+        )
         return ConversationHandler.END
 
     if data == ACCEPT:
-        restaurant_id = context.chat_data.get("suggested_restaurant_id")
-        db: DatabaseService = context.bot_data["db"]
-
-        # Get restaurant name for the message
-        result = await db.get_random_positive_restaurant(cuisine=None, exclude_ids=[])
-        # Just use the stored ID to show acceptance
-        await query.edit_message_text(
-            "Great choice! Enjoy your meal! 🍽️\n\n"
-            "Don't forget to log your experience afterwards!"
+        await asyncio.gather(
+            answer_task,
+            query.edit_message_text(
+                "Great choice! Enjoy your meal! 🍽️\n\n"
+                "Don't forget to log your experience afterwards!"
+            ),
         )
         return ConversationHandler.END
 
@@ -197,8 +239,11 @@ async def handle_confirmation(
             rejected.append(restaurant_id)
             context.chat_data["rejected_restaurants"] = rejected
 
-        return await suggest_restaurant(update, context)
+        state = await suggest_restaurant(update, context)
+        await answer_task
+        return state
 
+    await answer_task
     return CONFIRMING
 
 
@@ -217,12 +262,7 @@ async def timeout(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 
 def _get_sentiment_emoji(sentiment: str) -> str:
     """Get emoji for sentiment."""
-    return {
-        "positive": "👍",
-        "negative": "👎",
-        "neutral": "😐",
-        "mixed": "🤔",
-    }.get(sentiment, "")
+    return _SENTIMENT_EMOJI.get(sentiment, "")
 
 
 def get_what_to_eat_handler() -> ConversationHandler:
@@ -3,6 +3,8 @@
 CREATE TABLE IF NOT EXISTS restaurants (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
+    -- Normalized name keeps lookups on an index instead of LOWER() scans
+    name_normalized TEXT GENERATED ALWAYS AS (lower(trim(name))) VIRTUAL,
     google_place_id TEXT UNIQUE,
     address TEXT,
     latitude REAL,
@@ -34,8 +36,40 @@ CREATE TABLE IF NOT EXISTS entries (
 
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_restaurants_name ON restaurants(name);
+-- Unique name index backs the INSERT ... ON CONFLICT(name) upsert path
+CREATE UNIQUE INDEX IF NOT EXISTS idx_restaurants_name_unique ON restaurants(name);
 CREATE INDEX IF NOT EXISTS idx_restaurants_cuisine ON restaurants(cuisine);
 CREATE INDEX IF NOT EXISTS idx_entries_restaurant_id ON entries(restaurant_id);
 CREATE INDEX IF NOT EXISTS idx_entries_user_telegram_id ON entries(user_telegram_id);
 CREATE INDEX IF NOT EXISTS idx_entries_sentiment ON entries(sentiment);
 CREATE INDEX IF NOT EXISTS idx_entries_created_at ON entries(created_at);
+
+-- Composite indexes for the hot joins: the positive-sentiment restaurant
+-- sample and the per-restaurant entry listing ordered by recency
+CREATE INDEX IF NOT EXISTS idx_entries_sentiment_rest ON entries(sentiment, restaurant_id);
+CREATE INDEX IF NOT EXISTS idx_entries_rest_created ON entries(restaurant_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_restaurants_place ON restaurants(google_place_id) WHERE google_place_id IS NOT NULL;
+
+-- Full-text index backing the partial-name restaurant lookup. External
+-- content keeps the text stored once; the triggers keep it in sync.
+CREATE VIRTUAL TABLE IF NOT EXISTS restaurants_fts USING fts5(
+    name, cuisine, address,
+    content='restaurants', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS restaurants_fts_ai AFTER INSERT ON restaurants BEGIN
+    INSERT INTO restaurants_fts(rowid, name, cuisine, address)
+    VALUES (new.id, new.name, new.cuisine, new.address);
+END;
+
+CREATE TRIGGER IF NOT EXISTS restaurants_fts_ad AFTER DELETE ON restaurants BEGIN
+    INSERT INTO restaurants_fts(restaurants_fts, rowid, name, cuisine, address)
+    VALUES ('delete', old.id, old.name, old.cuisine, old.address);
+END;
+
+CREATE TRIGGER IF NOT EXISTS restaurants_fts_au AFTER UPDATE ON restaurants BEGIN
+    INSERT INTO restaurants_fts(restaurants_fts, rowid, name, cuisine, address)
+    VALUES ('delete', old.id, old.name, old.cuisine, old.address);
+    INSERT INTO restaurants_fts(rowid, name, cuisine, address)
+    VALUES (new.id, new.name, new.cuisine, new.address);
+END;
@@ -1,7 +1,23 @@
-"""Services for Food Memory Bot."""
+"""Services for Food Memory Bot.
 
-from .database import DatabaseService
-from .llm import LLMService
-from .places import PlacesService
+Re-exports are resolved lazily (PEP 562) so importing the package doesn't
+eagerly load the anthropic, aiosqlite, and httpx dependencies.
+"""
 
-__all__ = ["DatabaseService", "LLMService", "PlacesService"]
+from importlib import import_module
+
+__all__ = ["DatabaseService", "LLMService", "PlacesService", "SemanticCache"]
+
+_EXPORTS = {
+    "DatabaseService": "database",
+    "LLMService": "llm",
+    "PlacesService": "places",
+    "SemanticCache": "semantic_cache",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
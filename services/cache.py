@@ -0,0 +1,77 @@
+"""Small async caching utilities shared by the service layer."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+# Sentinel distinguishing "not cached" from a cached None result
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """TTL cache with per-key locks for async fetchers.
+
+    get_or_fetch() collapses concurrent lookups for the same key into a
+    single call to the fetch coroutine, so a burst of identical requests
+    triggers at most one underlying API/DB call. Results (including None,
+    for known misses) are cached for ttl seconds; None results can be
+    given a shorter none_ttl so transient failures don't pin a miss for
+    the full expiry window.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, none_ttl: float | None = None):
+        self.ttl = ttl
+        self.none_ttl = ttl if none_ttl is None else none_ttl
+        self.max_size = max_size
+        self._data: dict[str, tuple[float, Any]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the oldest entries past max_size."""
+        ttl = self.none_ttl if value is None else self.ttl
+        self._data[key] = (time.monotonic() + ttl, value)
+        while len(self._data) > self.max_size:
+            oldest = next(iter(self._data))
+            self._data.pop(oldest, None)
+            self._locks.pop(oldest, None)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single cached entry."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._data.clear()
+        self._locks.clear()
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value, or fetch and cache it.
+
+        Concurrent callers for the same key wait on a shared lock so the
+        fetch coroutine runs at most once per expiry window.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another waiter may have completed the fetch while we queued
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            value = await fetch()
+            self.set(key, value)
+            return value
@@ -1,11 +1,119 @@
 """Database service for Food Memory Bot using async SQLite."""
 
+import asyncio
 import json
+import random
 import aiosqlite
+from contextlib import asynccontextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
+from services.cache import AsyncTTLCache
+
+# Number of pooled connections. Writes still serialize through SQLite's
+# lock, but pooling keeps reads concurrent and page caches warm.
+POOL_SIZE = 8
+
+# Name lookups repeat within a log -> add-details -> query exchange; a
+# short TTL collapses those bursts without hiding new inserts for long.
+NAME_CACHE_TTL = 60
+
+# Size of sqlite3's per-connection prepared-statement cache. Hot queries
+# reuse identical SQL text, so re-parsing is skipped entirely.
+CACHED_STATEMENTS = 256
+
+# Explicit select lists keep positional row materialization stable even
+# as the tables grow columns (name_normalized, timestamps, ...)
+_RESTAURANT_COLS = (
+    "id, name, google_place_id, address, latitude, longitude, "
+    "cuisine, price_level, dine_in, takeout, delivery"
+)
+_RESTAURANT_COLS_R = ", ".join(f"r.{col}" for col in _RESTAURANT_COLS.split(", "))
+_ENTRY_COLS = (
+    "e.id, e.restaurant_id, e.user_name, e.user_telegram_id, e.dish, "
+    "e.exact_order, e.rating, e.notes, e.sentiment, e.sentiment_score, "
+    "e.tags, e.created_at, r.name AS restaurant_name"
+)
+
+# Hot-path SQL, hoisted so every call site issues identical statement
+# text and hits the prepared-statement cache
+_SQL_FIND_RESTAURANT_EXACT = f"SELECT {_RESTAURANT_COLS} FROM restaurants WHERE name_normalized = ? LIMIT 1"
+# Place-id and exact-name lookup fused into one round-trip; a place-id
+# match wins over a name match when both exist
+_SQL_FIND_RESTAURANT_BY_PLACE_OR_NAME = f"""SELECT {_RESTAURANT_COLS} FROM restaurants
+   WHERE google_place_id = ?1 OR name_normalized = ?2
+   ORDER BY (google_place_id = ?1) DESC LIMIT 1"""
+
+_SQL_INSERT_ENTRY = """INSERT INTO entries
+   (restaurant_id, user_name, user_telegram_id, dish, exact_order, rating, notes, sentiment, sentiment_score, tags)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Inexact name lookups go through the FTS index - token-prefix matches
+# over an inverted index instead of an unindexable LIKE '%...%' scan
+_SQL_FIND_RESTAURANT_FTS = f"""SELECT {_RESTAURANT_COLS_R} FROM restaurants_fts f
+   JOIN restaurants r ON r.id = f.rowid
+   WHERE restaurants_fts MATCH ? ORDER BY rank LIMIT 1"""
+
+# Optional filters are expressed as "?N IS NULL OR ..." so the statement
+# text is identical whichever filters are set and a single prepared
+# statement covers all inputs; SQLite short-circuits the NULL branches.
+_SQL_SEARCH_ENTRIES = f"""SELECT {_ENTRY_COLS} FROM entries e
+   JOIN restaurants r ON e.restaurant_id = r.id
+   WHERE (?1 IS NULL OR LOWER(r.cuisine) LIKE LOWER(?1) ESCAPE '\\')
+   AND (?2 IS NULL OR e.sentiment = ?2)
+   AND (?3 IS NULL OR e.user_telegram_id = ?3)
+   AND (?4 IS NULL OR LOWER(r.name) LIKE LOWER(?4) ESCAPE '\\'
+        OR LOWER(e.dish) LIKE LOWER(?4) ESCAPE '\\'
+        OR LOWER(e.notes) LIKE LOWER(?4) ESCAPE '\\')
+   ORDER BY e.created_at DESC LIMIT ?5"""
+
+# Candidate clause shared by the suggestion count/pick statements.
+# Exclusions are bound as one JSON array parameter: the SQL text stays
+# identical however many restaurants were rejected, so the prepared-
+# statement cache keeps hitting, and there's no 999-parameter ceiling.
+_SQL_SUGGEST_CANDIDATES = """FROM restaurants r
+   JOIN entries e ON r.id = e.restaurant_id
+   WHERE e.sentiment = 'positive'
+   AND NOT EXISTS (SELECT 1 FROM json_each(?1) je WHERE je.value = r.id)
+   AND (?2 IS NULL OR LOWER(r.cuisine) LIKE LOWER(?2) ESCAPE '\\')"""
+_SQL_SUGGEST_COUNT = f"SELECT COUNT(DISTINCT r.id) {_SQL_SUGGEST_CANDIDATES}"
+_SQL_SUGGEST_PICK = f"SELECT DISTINCT r.id {_SQL_SUGGEST_CANDIDATES} ORDER BY r.id LIMIT 1 OFFSET ?3"
+_SQL_SUGGEST_FETCH = f"""SELECT {_RESTAURANT_COLS_R}, {_ENTRY_COLS}
+   FROM restaurants r
+   JOIN entries e ON e.restaurant_id = r.id
+   WHERE r.id = ?
+   ORDER BY e.created_at DESC LIMIT ?"""
+
+# Single-statement restaurant upsert. A google_place_id conflict means the
+# row is already enriched and is returned untouched (the stored name wins);
+# a name conflict applies first-time Place enrichment only. Requires
+# SQLite >= 3.35 for multiple ON CONFLICT clauses and RETURNING.
+_SQL_UPSERT_RESTAURANT = """INSERT INTO restaurants
+   (name, google_place_id, address, latitude, longitude, cuisine, price_level, dine_in, takeout, delivery)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(google_place_id) DO UPDATE SET
+       updated_at = CURRENT_TIMESTAMP
+   ON CONFLICT(name) DO UPDATE SET
+       google_place_id = COALESCE(restaurants.google_place_id, excluded.google_place_id),
+       address = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                      THEN excluded.address ELSE restaurants.address END,
+       latitude = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                       THEN excluded.latitude ELSE restaurants.latitude END,
+       longitude = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                        THEN excluded.longitude ELSE restaurants.longitude END,
+       cuisine = COALESCE(restaurants.cuisine, excluded.cuisine),
+       price_level = COALESCE(restaurants.price_level, excluded.price_level),
+       dine_in = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                      THEN excluded.dine_in ELSE restaurants.dine_in END,
+       takeout = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                      THEN excluded.takeout ELSE restaurants.takeout END,
+       delivery = CASE WHEN restaurants.google_place_id IS NULL AND excluded.google_place_id IS NOT NULL
+                       THEN excluded.delivery ELSE restaurants.delivery END,
+       updated_at = CURRENT_TIMESTAMP
+   RETURNING """ + _RESTAURANT_COLS
+
 
 @dataclass
 class Restaurant:
@@ -36,73 +144,201 @@ class Entry:
     notes: Optional[str] = None
     sentiment: Optional[str] = None
     sentiment_score: Optional[float] = None
-    tags: list[str] = None
+    tags_json: Optional[str] = None  # Raw JSON from the tags column
     created_at: Optional[str] = None
     restaurant_name: Optional[str] = None  # For joined queries
 
+    @cached_property
+    def tags(self) -> list[str]:
+        """Tags list, decoded from tags_json on first access.
+
+        Most rows are rendered without ever reading tags, so the
+        json.loads is deferred until a caller actually asks.
+        """
+        return json.loads(self.tags_json) if self.tags_json else []
+
+
+def _like_pattern(term: str) -> str:
+    """Build a %term% LIKE pattern with user-supplied wildcards escaped.
+
+    Without this a search term containing % or _ would match everything.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_prefix_query(text: str) -> str:
+    """Turn free text into an FTS5 token-prefix query ("siam stat" -> '"siam"* "stat"*')."""
+    return " ".join(
+        '"{}"*'.format(token.replace('"', '""')) for token in text.split()
+    )
+
+
+def _row_to_restaurant(row) -> Restaurant:
+    """Build a Restaurant from a _RESTAURANT_COLS-ordered row.
+
+    Positional access skips the per-field name hashing that keyword Row
+    lookups pay on every materialized row.
+    """
+    return Restaurant(
+        id=row[0],
+        name=row[1],
+        google_place_id=row[2],
+        address=row[3],
+        latitude=row[4],
+        longitude=row[5],
+        cuisine=row[6],
+        price_level=row[7],
+        dine_in=bool(row[8]),
+        takeout=bool(row[9]),
+        delivery=bool(row[10]),
+    )
+
+
+def _row_to_entry(row) -> Entry:
+    """Build an Entry from an _ENTRY_COLS-ordered row."""
+    return Entry(
+        id=row[0],
+        restaurant_id=row[1],
+        user_name=row[2],
+        user_telegram_id=row[3],
+        dish=row[4],
+        exact_order=row[5],
+        rating=row[6],
+        notes=row[7],
+        sentiment=row[8],
+        sentiment_score=row[9],
+        tags_json=row[10],
+        created_at=row[11],
+        restaurant_name=row[12],
+    )
+
 
 class DatabaseService:
-    """Async SQLite database operations."""
+    """Async SQLite database operations.
+
+    Connections are pooled (POOL_SIZE, WAL mode) so concurrent handlers
+    read in parallel instead of queueing behind aiosqlite's single
+    worker thread; writes still serialize on SQLite's lock.
+    """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool_size: int = POOL_SIZE):
         self.db_path = db_path
-        self._connection: Optional[aiosqlite.Connection] = None
+        self.pool_size = pool_size
+        self._pool: Optional[asyncio.Queue] = None
+        self._name_cache = AsyncTTLCache(ttl=NAME_CACHE_TTL, max_size=512)
+        # Cuisine list only changes when a restaurant row is written
+        self._cuisines_cache: Optional[list[str]] = None
+        # Monotonic write counter, used to invalidate caches keyed on DB state
+        self.version = 0
 
     async def initialize(self) -> None:
-        """Initialize database and create tables from schema."""
+        """Initialize database, create tables, and open the connection pool."""
         schema_path = Path(__file__).parent.parent / "models" / "schema.sql"
         schema = schema_path.read_text()
 
         async with aiosqlite.connect(self.db_path) as db:
+            # Databases created before the FTS table existed need a one-off
+            # backfill after the schema script creates it
+            cursor = await db.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'restaurants_fts'"
+            )
+            had_fts = await cursor.fetchone() is not None
+
             await db.executescript(schema)
+
+            if not had_fts:
+                await db.execute(
+                    "INSERT INTO restaurants_fts(restaurants_fts) VALUES('rebuild')"
+                )
+
+            # Migrate databases created before name_normalized was part of
+            # the schema (the index lives here so it runs after the ALTER).
+            # table_xinfo, not table_info: only the former lists virtual
+            # generated columns, so the plain pragma would re-run the
+            # ALTER on every startup and fail on the duplicate column
+            cursor = await db.execute("PRAGMA table_xinfo(restaurants)")
+            columns = [row[1] for row in await cursor.fetchall()]
+            if "name_normalized" not in columns:
+                await db.execute(
+                    "ALTER TABLE restaurants ADD COLUMN name_normalized TEXT "
+                    "GENERATED ALWAYS AS (lower(trim(name))) VIRTUAL"
+                )
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_restaurants_name_norm "
+                "ON restaurants(name_normalized)"
+            )
             await db.commit()
 
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
-            self._connection = await aiosqlite.connect(self.db_path)
-            self._connection.row_factory = aiosqlite.Row
-        return self._connection
+        self._pool = asyncio.Queue(maxsize=self.pool_size)
+        for _ in range(self.pool_size):
+            await self._pool.put(await self._open_connection())
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a connection with per-connection performance pragmas."""
+        conn = await aiosqlite.connect(self.db_path, cached_statements=CACHED_STATEMENTS)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA cache_size=-64000")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        await conn.execute("PRAGMA mmap_size=268435456")
+        await conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @asynccontextmanager
+    async def _acquire(self):
+        """Borrow a connection from the pool, returning it on exit.
+
+        If the caller raises, the connection is discarded and replaced with
+        a fresh one rather than returned in an unknown state.
+        """
+        conn = await self._pool.get()
+        try:
+            yield conn
+        except Exception:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+            await self._pool.put(await self._open_connection())
+            raise
+        else:
+            await self._pool.put(conn)
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+        """Close all pooled connections."""
+        if self._pool:
+            while not self._pool.empty():
+                conn = self._pool.get_nowait()
+                await conn.close()
+            self._pool = None
 
     async def find_restaurant_by_name(self, name: str) -> Optional[Restaurant]:
-        """Find restaurant by name using fuzzy matching."""
-        db = await self._get_connection()
-        # Try exact match first, then LIKE match
-        cursor = await db.execute(
-            "SELECT * FROM restaurants WHERE LOWER(name) = LOWER(?) LIMIT 1",
-            (name,)
+        """Find restaurant by name using fuzzy matching.
+
+        Lookups are cached briefly (see NAME_CACHE_TTL); the cache is
+        cleared whenever a restaurant row is inserted or updated.
+        """
+        return await self._name_cache.get_or_fetch(
+            name.strip().lower(),
+            lambda: self._find_restaurant_by_name_uncached(name),
         )
-        row = await cursor.fetchone()
 
-        if not row:
-            # Try partial match
-            cursor = await db.execute(
-                "SELECT * FROM restaurants WHERE LOWER(name) LIKE LOWER(?) LIMIT 1",
-                (f"%{name}%",)
-            )
+    async def _find_restaurant_by_name_uncached(self, name: str) -> Optional[Restaurant]:
+        normalized = name.strip().lower()
+        fts_query = _fts_prefix_query(normalized)
+        async with self._acquire() as db:
+            # Try exact match first (indexed on name_normalized), then a
+            # token-prefix match against the full-text index
+            cursor = await db.execute(_SQL_FIND_RESTAURANT_EXACT, (normalized,))
             row = await cursor.fetchone()
 
-        if row:
-            return Restaurant(
-                id=row["id"],
-                name=row["name"],
-                google_place_id=row["google_place_id"],
-                address=row["address"],
-                latitude=row["latitude"],
-                longitude=row["longitude"],
-                cuisine=row["cuisine"],
-                price_level=row["price_level"],
-                dine_in=bool(row["dine_in"]),
-                takeout=bool(row["takeout"]),
-                delivery=bool(row["delivery"]),
-            )
-        return None
+            if not row and fts_query:
+                cursor = await db.execute(_SQL_FIND_RESTAURANT_FTS, (fts_query,))
+                row = await cursor.fetchone()
+
+        return _row_to_restaurant(row) if row else None
 
     async def find_or_create_restaurant(
         self,
@@ -117,68 +353,36 @@ class DatabaseService:
         takeout: bool = False,
         delivery: bool = False,
     ) -> Restaurant:
-        """Find existing restaurant or create new one with Place data."""
-        db = await self._get_connection()
+        """Find existing restaurant or create new one with Place data.
 
-        # Check if restaurant exists by google_place_id first
+        The update-or-insert decision runs as a single upsert statement
+        (one commit) instead of the old lookup / UPDATE / INSERT sequence.
+        Restaurants already found by name and needing no enrichment are
+        returned without writing at all.
+        """
         if google_place_id:
-            cursor = await db.execute(
-                "SELECT * FROM restaurants WHERE google_place_id = ?",
-                (google_place_id,)
-            )
-            row = await cursor.fetchone()
-            if row:
-                return Restaurant(
-                    id=row["id"],
-                    name=row["name"],
-                    google_place_id=row["google_place_id"],
-                    address=row["address"],
-                    latitude=row["latitude"],
-                    longitude=row["longitude"],
-                    cuisine=row["cuisine"],
-                    price_level=row["price_level"],
-                    dine_in=bool(row["dine_in"]),
-                    takeout=bool(row["takeout"]),
-                    delivery=bool(row["delivery"]),
+            # Place-id and exact-name checks are independent - issue them
+            # as one OR query instead of two round-trips
+            async with self._acquire() as db:
+                cursor = await db.execute(
+                    _SQL_FIND_RESTAURANT_BY_PLACE_OR_NAME,
+                    (google_place_id, name.strip().lower()),
                 )
+                row = await cursor.fetchone()
+            existing = _row_to_restaurant(row) if row else None
+            if existing is None:
+                # Fall back to the fuzzy path ("Siam" -> "Siam Station")
+                existing = await self.find_restaurant_by_name(name)
+        else:
+            existing = await self.find_restaurant_by_name(name)
 
-        # Check by name
-        existing = await self.find_restaurant_by_name(name)
         if existing:
-            # Update with new Place data if we have it
-            if google_place_id and not existing.google_place_id:
-                await db.execute(
-                    """UPDATE restaurants SET
-                       google_place_id = ?, address = ?, latitude = ?, longitude = ?,
-                       cuisine = COALESCE(?, cuisine), price_level = COALESCE(?, price_level),
-                       dine_in = ?, takeout = ?, delivery = ?, updated_at = CURRENT_TIMESTAMP
-                       WHERE id = ?""",
-                    (google_place_id, address, latitude, longitude, cuisine, price_level,
-                     dine_in, takeout, delivery, existing.id)
-                )
-                await db.commit()
-                existing.google_place_id = google_place_id
-                existing.address = address
-                existing.latitude = latitude
-                existing.longitude = longitude
-                existing.cuisine = cuisine or existing.cuisine
-                existing.price_level = price_level or existing.price_level
-                existing.dine_in = dine_in
-                existing.takeout = takeout
-                existing.delivery = delivery
-            return existing
-
-        # Create new restaurant
-        cursor = await db.execute(
-            """INSERT INTO restaurants
-               (name, google_place_id, address, latitude, longitude, cuisine, price_level, dine_in, takeout, delivery)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (name, google_place_id, address, latitude, longitude, cuisine, price_level, dine_in, takeout, delivery)
-        )
-        await db.commit()
+            if not google_place_id or existing.google_place_id:
+                return existing
+            # Canonical stored name, so the name conflict target matches
+            name = existing.name
 
-        return Restaurant(
-            id=cursor.lastrowid,
+        return await self.upsert_restaurant(
             name=name,
             google_place_id=google_place_id,
             address=address,
@@ -191,6 +395,40 @@ class DatabaseService:
             delivery=delivery,
         )
 
+    async def upsert_restaurant(
+        self,
+        name: str,
+        google_place_id: Optional[str] = None,
+        address: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        cuisine: Optional[str] = None,
+        price_level: Optional[int] = None,
+        dine_in: bool = True,
+        takeout: bool = False,
+        delivery: bool = False,
+    ) -> Restaurant:
+        """Insert a restaurant, or enrich the existing row, in one statement.
+
+        Uses a single INSERT ... ON CONFLICT ... RETURNING statement (see
+        _SQL_UPSERT_RESTAURANT) so the lookup, update-or-insert decision,
+        and re-read happen in one round-trip with one commit. An existing
+        google_place_id is never overwritten, and Place enrichment
+        (address, service flags, ...) is only applied the first time a
+        place_id arrives - matching the old multi-query behavior.
+        """
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                _SQL_UPSERT_RESTAURANT,
+                (name, google_place_id, address, latitude, longitude, cuisine, price_level, dine_in, takeout, delivery)
+            )
+            row = await cursor.fetchone()
+            await db.commit()
+        self._name_cache.clear()
+        self._cuisines_cache = None
+
+        return _row_to_restaurant(row)
+
     async def add_entry(
         self,
         restaurant_id: int,
@@ -205,16 +443,15 @@ class DatabaseService:
         tags: Optional[list[str]] = None,
     ) -> Entry:
         """Add a new food entry."""
-        db = await self._get_connection()
         tags_json = json.dumps(tags) if tags else None
 
-        cursor = await db.execute(
-            """INSERT INTO entries
-               (restaurant_id, user_name, user_telegram_id, dish, exact_order, rating, notes, sentiment, sentiment_score, tags)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (restaurant_id, user_name, user_telegram_id, dish, exact_order, rating, notes, sentiment, sentiment_score, tags_json)
-        )
-        await db.commit()
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                _SQL_INSERT_ENTRY,
+                (restaurant_id, user_name, user_telegram_id, dish, exact_order, rating, notes, sentiment, sentiment_score, tags_json)
+            )
+            await db.commit()
+        self.version += 1
 
         return Entry(
             id=cursor.lastrowid,
@@ -227,86 +464,86 @@ class DatabaseService:
             notes=notes,
             sentiment=sentiment,
             sentiment_score=sentiment_score,
-            tags=tags or [],
+            tags_json=tags_json,
         )
 
+    async def add_entries(self, entries: list[dict]) -> list[int]:
+        """Insert several entries in one transaction, returning their ids.
+
+        Each item takes the same keyword fields as add_entry. N inserts
+        cost one executemany and one commit (one fsync) instead of N of
+        each - useful when a single message logs multiple dishes.
+        """
+        if not entries:
+            return []
+
+        rows = [
+            (
+                e["restaurant_id"],
+                e.get("user_name"),
+                e.get("user_telegram_id"),
+                e.get("dish"),
+                e.get("exact_order"),
+                e.get("rating"),
+                e.get("notes"),
+                e.get("sentiment"),
+                e.get("sentiment_score"),
+                json.dumps(e["tags"]) if e.get("tags") else None,
+            )
+            for e in entries
+        ]
+
+        async with self._acquire() as db:
+            await db.executemany(_SQL_INSERT_ENTRY, rows)
+            # Ids are contiguous: the inserts share one transaction, so
+            # no other writer can interleave before the commit
+            cursor = await db.execute("SELECT last_insert_rowid()")
+            last_id = (await cursor.fetchone())[0]
+            await db.commit()
+        self.version += 1
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
     async def update_entry(self, entry_id: int, **kwargs) -> bool:
         """Update an existing entry with provided fields."""
-        db = await self._get_connection()
-
         if "tags" in kwargs and kwargs["tags"] is not None:
             kwargs["tags"] = json.dumps(kwargs["tags"])
 
         set_clauses = ", ".join(f"{k} = ?" for k in kwargs.keys())
         values = list(kwargs.values()) + [entry_id]
 
-        await db.execute(
-            f"UPDATE entries SET {set_clauses} WHERE id = ?",
-            values
-        )
-        await db.commit()
+        async with self._acquire() as db:
+            await db.execute(
+                f"UPDATE entries SET {set_clauses} WHERE id = ?",
+                values
+            )
+            await db.commit()
+        self.version += 1
         return True
 
     async def get_entry(self, entry_id: int) -> Optional[Entry]:
         """Get entry by ID."""
-        db = await self._get_connection()
-        cursor = await db.execute(
-            """SELECT e.*, r.name as restaurant_name FROM entries e
-               JOIN restaurants r ON e.restaurant_id = r.id
-               WHERE e.id = ?""",
-            (entry_id,)
-        )
-        row = await cursor.fetchone()
-        if row:
-            tags = json.loads(row["tags"]) if row["tags"] else []
-            return Entry(
-                id=row["id"],
-                restaurant_id=row["restaurant_id"],
-                user_name=row["user_name"],
-                user_telegram_id=row["user_telegram_id"],
-                dish=row["dish"],
-                exact_order=row["exact_order"],
-                rating=row["rating"],
-                notes=row["notes"],
-                sentiment=row["sentiment"],
-                sentiment_score=row["sentiment_score"],
-                tags=tags,
-                created_at=row["created_at"],
-                restaurant_name=row["restaurant_name"],
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                f"""SELECT {_ENTRY_COLS} FROM entries e
+                   JOIN restaurants r ON e.restaurant_id = r.id
+                   WHERE e.id = ?""",
+                (entry_id,)
             )
-        return None
+            row = await cursor.fetchone()
+        return _row_to_entry(row) if row else None
 
     async def get_entries_for_restaurant(self, restaurant_id: int, limit: int = 20) -> list[Entry]:
         """Get all entries for a specific restaurant."""
-        db = await self._get_connection()
-        cursor = await db.execute(
-            """SELECT e.*, r.name as restaurant_name FROM entries e
-               JOIN restaurants r ON e.restaurant_id = r.id
-               WHERE e.restaurant_id = ?
-               ORDER BY e.created_at DESC LIMIT ?""",
-            (restaurant_id, limit)
-        )
-        rows = await cursor.fetchall()
-
-        entries = []
-        for row in rows:
-            tags = json.loads(row["tags"]) if row["tags"] else []
-            entries.append(Entry(
-                id=row["id"],
-                restaurant_id=row["restaurant_id"],
-                user_name=row["user_name"],
-                user_telegram_id=row["user_telegram_id"],
-                dish=row["dish"],
-                exact_order=row["exact_order"],
-                rating=row["rating"],
-                notes=row["notes"],
-                sentiment=row["sentiment"],
-                sentiment_score=row["sentiment_score"],
-                tags=tags,
-                created_at=row["created_at"],
-                restaurant_name=row["restaurant_name"],
-            ))
-        return entries
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                f"""SELECT {_ENTRY_COLS} FROM entries e
+                   JOIN restaurants r ON e.restaurant_id = r.id
+                   WHERE e.restaurant_id = ?
+                   ORDER BY e.created_at DESC LIMIT ?""",
+                (restaurant_id, limit)
+            )
+            rows = await cursor.fetchall()
+        return [_row_to_entry(row) for row in rows]
 
     async def search_entries(
         self,
@@ -316,109 +553,83 @@ class DatabaseService:
         search_term: Optional[str] = None,
         limit: int = 20,
     ) -> list[Entry]:
-        """Search entries with various filters."""
-        db = await self._get_connection()
-
-        query = """SELECT e.*, r.name as restaurant_name FROM entries e
-                   JOIN restaurants r ON e.restaurant_id = r.id WHERE 1=1"""
-        params = []
-
-        if cuisine:
-            query += " AND LOWER(r.cuisine) LIKE LOWER(?)"
-            params.append(f"%{cuisine}%")
-
-        if sentiment:
-            query += " AND e.sentiment = ?"
-            params.append(sentiment)
-
-        if user_telegram_id:
-            query += " AND e.user_telegram_id = ?"
-            params.append(user_telegram_id)
-
-        if search_term:
-            query += " AND (LOWER(r.name) LIKE LOWER(?) OR LOWER(e.dish) LIKE LOWER(?) OR LOWER(e.notes) LIKE LOWER(?))"
-            params.extend([f"%{search_term}%"] * 3)
-
-        query += " ORDER BY e.created_at DESC LIMIT ?"
-        params.append(limit)
-
-        cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-
-        entries = []
-        for row in rows:
-            tags = json.loads(row["tags"]) if row["tags"] else []
-            entries.append(Entry(
-                id=row["id"],
-                restaurant_id=row["restaurant_id"],
-                user_name=row["user_name"],
-                user_telegram_id=row["user_telegram_id"],
-                dish=row["dish"],
-                exact_order=row["exact_order"],
-                rating=row["rating"],
-                notes=row["notes"],
-                sentiment=row["sentiment"],
-                sentiment_score=row["sentiment_score"],
-                tags=tags,
-                created_at=row["created_at"],
-                restaurant_name=row["restaurant_name"],
-            ))
-        return entries
+        """Search entries with various filters.
+
+        Unset filters are bound as NULL rather than spliced out of the
+        SQL, so every call reuses the same prepared statement.
+        """
+        params = (
+            _like_pattern(cuisine) if cuisine else None,
+            sentiment or None,
+            user_telegram_id or None,
+            _like_pattern(search_term) if search_term else None,
+            limit,
+        )
+
+        async with self._acquire() as db:
+            cursor = await db.execute(_SQL_SEARCH_ENTRIES, params)
+            rows = await cursor.fetchall()
+        return [_row_to_entry(row) for row in rows]
 
     async def get_distinct_cuisines(self) -> list[str]:
-        """Get list of distinct cuisines from saved restaurants."""
-        db = await self._get_connection()
-        cursor = await db.execute(
-            "SELECT DISTINCT cuisine FROM restaurants WHERE cuisine IS NOT NULL AND cuisine != '' ORDER BY cuisine"
-        )
-        rows = await cursor.fetchall()
-        return [row["cuisine"] for row in rows]
+        """Get list of distinct cuisines from saved restaurants.
+
+        Cached in memory until a restaurant row is written - the scan only
+        reruns after an upsert, not on every /whattoeat.
+        """
+        if self._cuisines_cache is not None:
+            return self._cuisines_cache
+
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                "SELECT DISTINCT cuisine FROM restaurants WHERE cuisine IS NOT NULL AND cuisine != '' ORDER BY cuisine"
+            )
+            rows = await cursor.fetchall()
+        self._cuisines_cache = [row["cuisine"] for row in rows]
+        return self._cuisines_cache
 
     async def get_random_positive_restaurant(
         self,
         cuisine: Optional[str] = None,
         exclude_ids: Optional[list[int]] = None,
+        entry_limit: int = 5,
     ) -> Optional[tuple[Restaurant, list[Entry]]]:
-        """Get a random restaurant with positive sentiment entries."""
-        db = await self._get_connection()
-
-        query = """SELECT DISTINCT r.* FROM restaurants r
-                   JOIN entries e ON r.id = e.restaurant_id
-                   WHERE e.sentiment = 'positive'"""
-        params = []
+        """Get a random restaurant with positive sentiment entries.
+
+        Samples in two steps - count the candidates, then fetch one at a
+        random offset - instead of ORDER BY RANDOM(), which sorts every
+        matching row just to discard all but one. The chosen restaurant
+        and its most recent entries come back from a single joined query
+        rather than a second round-trip.
+        """
+        filters = (
+            json.dumps(exclude_ids or []),
+            _like_pattern(cuisine) if cuisine else None,
+        )
 
-        if cuisine:
-            query += " AND LOWER(r.cuisine) LIKE LOWER(?)"
-            params.append(f"%{cuisine}%")
+        async with self._acquire() as db:
+            cursor = await db.execute(_SQL_SUGGEST_COUNT, filters)
+            count = (await cursor.fetchone())[0]
 
-        if exclude_ids:
-            placeholders = ",".join("?" * len(exclude_ids))
-            query += f" AND r.id NOT IN ({placeholders})"
-            params.extend(exclude_ids)
+            if not count:
+                return None
 
-        query += " ORDER BY RANDOM() LIMIT 1"
+            offset = random.randrange(count)
+            cursor = await db.execute(_SQL_SUGGEST_PICK, filters + (offset,))
+            picked = await cursor.fetchone()
+            if not picked:
+                return None
 
-        cursor = await db.execute(query, params)
-        row = await cursor.fetchone()
+            # One joined query for the restaurant and its recent entries;
+            # restaurant columns first, then the standard entry layout
+            cursor = await db.execute(_SQL_SUGGEST_FETCH, (picked[0], entry_limit))
+            rows = await cursor.fetchall()
 
-        if not row:
+        if not rows:
             return None
 
-        restaurant = Restaurant(
-            id=row["id"],
-            name=row["name"],
-            google_place_id=row["google_place_id"],
-            address=row["address"],
-            latitude=row["latitude"],
-            longitude=row["longitude"],
-            cuisine=row["cuisine"],
-            price_level=row["price_level"],
-            dine_in=bool(row["dine_in"]),
-            takeout=bool(row["takeout"]),
-            delivery=bool(row["delivery"]),
-        )
-
-        entries = await self.get_entries_for_restaurant(restaurant.id, limit=5)
+        restaurant = _row_to_restaurant(rows[0])
+        entries = [_row_to_entry(row[11:]) for row in rows]
         return restaurant, entries
 
     async def get_restaurant_by_name(self, name: str) -> Optional[Restaurant]:
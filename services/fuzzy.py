@@ -0,0 +1,40 @@
+"""Fuzzy string matching for restaurant name comparison."""
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance between two strings (two-row dynamic programming)."""
+    if a == b:
+        return 0
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+
+    # Keep the inner loop over the shorter string
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            current.append(min(
+                previous[j] + 1,        # deletion
+                current[j - 1] + 1,     # insertion
+                previous[j - 1] + cost  # substitution
+            ))
+        previous = current
+
+    return previous[-1]
+
+
+def ratio(a: str, b: str) -> float:
+    """Similarity between two strings in [0, 1] based on edit distance.
+
+    1.0 means identical; 0.0 means nothing in common. Typos like
+    "Siam Sation" vs "Siam Station" score well above 0.9.
+    """
+    if not a and not b:
+        return 1.0
+    return 1.0 - levenshtein(a, b) / max(len(a), len(b))
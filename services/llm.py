@@ -1,14 +1,85 @@
 """LLM service for intent parsing and structured extraction using Claude."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import re
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, model_validator
 import anthropic
+import httpx
+import orjson
+
+from services.cache import AsyncTTLCache
+from services.ratelimit import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+MODEL = "claude-sonnet-4-20250514"
+
+# Strips a ```json ... ``` fence around the response in a single pass
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+# Intents with tiny, unambiguous trigger sets are classified locally -
+# one regex match instead of a full Claude round-trip. Patterns are
+# deliberately conservative: anything that mentions a restaurant, dish,
+# or qualifier falls through to the model.
+_GREETING_RE = re.compile(r"^\s*(?:hi|hey|hello|yo|sup|howdy)\b[\s!.?]*(?:bot\s*[!.?\s]*)?$", re.IGNORECASE)
+_WHAT_TO_EAT_RE = re.compile(
+    r"^\s*(?:what|where)\s+should\s+(?:we|i)\s+(?:eat|go|order)"
+    r"(?:\s+(?:for\s+)?(?:dinner|lunch|breakfast|food|tonight|today))?\s*[!?.]*\s*$",
+    re.IGNORECASE,
+)
+
+
+def _fast_intent(text: str) -> Optional["MessageAnalysis"]:
+    """Classify trivially-patterned messages without calling Claude."""
+    if _GREETING_RE.match(text):
+        return MessageAnalysis(intent=Intent.GREETING, confidence=0.95)
+    if _WHAT_TO_EAT_RE.match(text):
+        return MessageAnalysis(intent=Intent.WHAT_TO_EAT, confidence=0.95)
+    return None
+
+# Bound on the answer_query exact-match cache
+ANSWER_CACHE_SIZE = 500
+
+# Exact-match analysis cache: identical request payloads (duplicate
+# Telegram deliveries, retries) are answered without touching the API
+# or the similarity scan
+ANALYSIS_CACHE_TTL = 3600
+ANALYSIS_CACHE_SIZE = 4096
+
+# Micro-batching: analyses arriving within the flush window ride one
+# Claude call instead of one each
+BATCH_MAX = 8
+BATCH_FLUSH_MS = 50
+
+# Client-side throttle: stay under the workspace requests-per-minute and
+# input-tokens-per-minute caps and bound burst concurrency instead of
+# tripping 429s
+REQUESTS_PER_MINUTE = 50
+INPUT_TOKENS_PER_MINUTE = 40_000
+MAX_CONCURRENT_REQUESTS = 8
+
+# Cap on estimated tokens of prior conversation sent with each analysis
+CONTEXT_TOKEN_BUDGET = 1024
+
+
+@lru_cache(maxsize=4096)
+def _estimate_tokens(content: str) -> int:
+    """Estimate the token count of a message (~4 chars/token for chat).
+
+    An estimate is enough for budgeting, and avoids pulling in a
+    tokenizer dependency; cached since the same history turns recur on
+    every message in a conversation.
+    """
+    return len(content) // 4 + 1
+
 
 class Intent(str, Enum):
     """Message intent types."""
@@ -21,25 +92,93 @@ class Intent(str, Enum):
     UNKNOWN = "unknown"
 
 
+class Sentiment(str, Enum):
+    """Sentiment labels for logged experiences."""
+    POSITIVE = "positive"
+    NEGATIVE = "negative"
+    NEUTRAL = "neutral"
+    MIXED = "mixed"
+
+
+_VALID_SENTIMENTS = frozenset(s.value for s in Sentiment)
+
+
+def _sentiment_label(score: float) -> str:
+    """Map a sentiment score to its label.
+
+    The ranges mirror the sentiment guidelines in SYSTEM_PROMPT. They
+    stay as explicit comparisons rather than a bisect table because the
+    boundaries are closed on the neutral/positive/negative sides
+    (-0.2 <= s <= 0.2 is neutral, s >= 0.5 is positive) - a sorted-
+    threshold lookup can't represent that exactly.
+    """
+    if score >= 0.5:
+        return "positive"
+    if score <= -0.5:
+        return "negative"
+    if -0.2 <= score <= 0.2:
+        return "neutral"
+    return "mixed"
+
+
+def _coerce_numeric_sentiment(data: dict) -> None:
+    """Fold a numeric sentiment from the LLM into (label, score) in place.
+
+    The model occasionally returns the score where the label belongs;
+    recover the label and keep the number as sentiment_score when none
+    was given.
+    """
+    sentiment = data.get("sentiment")
+    if isinstance(sentiment, bool) or not isinstance(sentiment, (int, float)):
+        return
+    data["sentiment"] = _sentiment_label(sentiment)
+    if data.get("sentiment_score") is None:
+        data["sentiment_score"] = float(sentiment)
+
+
 class ParsedLogEntry(BaseModel):
     """Structured log entry extracted from natural language."""
     restaurant_name: str = Field(description="Name of the restaurant")
     dish_name: Optional[str] = Field(default=None, description="Name of the dish ordered")
-    sentiment: str = Field(default="neutral", description="Overall sentiment: positive, negative, neutral, or mixed")
+    sentiment: Sentiment = Field(default=Sentiment.NEUTRAL, description="Overall sentiment: positive, negative, neutral, or mixed")
     sentiment_score: float = Field(default=0.0, description="Sentiment score from -1.0 (negative) to 1.0 (positive)")
     tags: list[str] = Field(default_factory=list, description="Tags like 'spicy', 'good value', 'slow service'")
     notes: Optional[str] = Field(default=None, description="Additional notes or comments")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize(cls, data):
+        """Absorb LLM inconsistencies during validation, in one pass."""
+        if isinstance(data, dict):
+            _coerce_numeric_sentiment(data)
+            if data.get("sentiment") not in _VALID_SENTIMENTS and "sentiment" in data:
+                data["sentiment"] = "neutral"
+            if data.get("tags") is None:
+                data["tags"] = []
+        return data
+
 
 class ParsedDetails(BaseModel):
     """Additional details to add to a previous entry."""
     restaurant_name: Optional[str] = Field(default=None, description="Restaurant name if explicitly mentioned")
     dish_name: Optional[str] = Field(default=None, description="Dish name if mentioned")
     notes: Optional[str] = Field(default=None, description="Additional notes or comments")
-    sentiment: Optional[str] = Field(default=None, description="Updated sentiment if expressed")
+    sentiment: Optional[Sentiment] = Field(default=None, description="Updated sentiment if expressed")
     sentiment_score: Optional[float] = Field(default=None, description="Updated sentiment score")
     tags: list[str] = Field(default_factory=list, description="Additional tags to add")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize(cls, data):
+        """Absorb LLM inconsistencies during validation, in one pass."""
+        if isinstance(data, dict):
+            _coerce_numeric_sentiment(data)
+            if data.get("sentiment") is not None and data["sentiment"] not in _VALID_SENTIMENTS:
+                data["sentiment"] = None
+            if data.get("tags") is None:
+                data["tags"] = []
+        return data
+
 
 class ParsedQuery(BaseModel):
     """Parsed query for searching entries."""
@@ -116,13 +255,230 @@ Always respond with valid JSON matching the MessageAnalysis schema. Do not inclu
   "clarification_needed": "..." // if confidence is low
 }"""
 
+ANSWER_SYSTEM_PROMPT = """You are a helpful assistant for a food/restaurant logging bot.
+The user is asking a question about their saved restaurant experiences.
+
+Based on the data provided, give a friendly, conversational response that directly answers their question.
+- Be concise but helpful
+- If they ask about their "usual" or "go-to" order, look for patterns in what they've ordered
+- If they ask about recommendations, consider sentiment and frequency
+- Include specific dish names when relevant
+- If there's an exact_order saved, mention that's their saved order
+- If the data doesn't have enough info to answer, say so honestly
+- Keep response under 3-4 sentences unless more detail is needed"""
+
+# The system prompts are static, so they're sent as cache_control blocks:
+# Anthropic's prompt cache processes the prefix once per 5-minute window
+# instead of re-billing the full ~1k tokens on every call. Per-user data
+# stays in messages, which is what keeps the prefix cacheable.
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+_ANSWER_SYSTEM_BLOCKS = [
+    {"type": "text", "text": ANSWER_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+# Token estimates for the static prompts, computed once at import. Every
+# call's throttle math re-estimates the same strings; evaluating them
+# here warms _estimate_tokens's cache so that work never repeats.
+SYSTEM_PROMPT_TOKENS = _estimate_tokens(SYSTEM_PROMPT)
+ANSWER_SYSTEM_PROMPT_TOKENS = _estimate_tokens(ANSWER_SYSTEM_PROMPT)
+
+
+def _estimated_input_tokens(request: dict) -> int:
+    """Estimate the input tokens of a messages.create/stream payload."""
+    total = sum(_estimate_tokens(block["text"]) for block in request.get("system", ()))
+    total += sum(_estimate_tokens(msg["content"]) for msg in request.get("messages", ()))
+    return total
+
+
+class _BatchAnalyzer:
+    """Coalesces concurrent analyze_message calls into one Claude call.
+
+    Requests queue briefly (BATCH_FLUSH_MS); whatever accumulates - up
+    to BATCH_MAX - is sent as one numbered prompt that returns a JSON
+    array of MessageAnalysis objects. A lone request in the window takes
+    the normal per-message path unchanged, and a malformed batch
+    response falls back to per-message calls, so batching can only ever
+    trade latency it already saved.
+    """
+
+    def __init__(self, service: "LLMService"):
+        self._service = service
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def analyze(self, text: str, context: Optional[list[dict]]) -> MessageAnalysis:
+        """Queue a message for analysis and await its result."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, context, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker task and let in-flight dispatches finish."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + BATCH_FLUSH_MS / 1000
+            while len(batch) < BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch in its own task so the collector resumes draining
+            # immediately; batches overlap under the service's rate
+            # limiter and concurrency semaphore instead of each one
+            # head-of-line blocking the next window
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple]) -> None:
+        if len(batch) == 1:
+            text, context, future = batch[0]
+            await self._finish(future, self._service._analyze_direct(text, context))
+            return
+
+        try:
+            analyses = await self._analyze_batch(batch)
+        except Exception as e:
+            logger.warning(f"Batched analysis failed, falling back to per-message calls: {e}")
+            await asyncio.gather(*(
+                self._finish(future, self._service._analyze_direct(text, context))
+                for text, context, future in batch
+            ))
+            return
+
+        for (_, _, future), analysis in zip(batch, analyses):
+            if not future.done():
+                future.set_result(analysis)
+
+    @staticmethod
+    async def _finish(future: asyncio.Future, coro) -> None:
+        """Resolve a waiter's future from a coroutine, error included."""
+        try:
+            result = await coro
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _analyze_batch(self, batch: list[tuple]) -> list[MessageAnalysis]:
+        parts = [
+            "Analyze each of the following numbered messages independently. "
+            "Respond with ONLY a JSON array whose element N is the "
+            "MessageAnalysis object for message N, in order.",
+            "",
+        ]
+        for i, (text, context, _) in enumerate(batch, 1):
+            # The current message sits last in context; surface the couple
+            # of turns before it so follow-ups still resolve
+            recent = ""
+            if context:
+                recent = " | ".join(
+                    f"{msg['role']}: {msg['content']}" for msg in context[-3:-1]
+                )
+            if recent:
+                parts.append(f"Message {i} (recent conversation: {recent}):")
+            else:
+                parts.append(f"Message {i}:")
+            parts.append(text)
+            parts.append("")
+
+        response = await self._service._create(
+            model=MODEL,
+            max_tokens=4096,
+            system=_SYSTEM_BLOCKS,
+            messages=[{"role": "user", "content": "\n".join(parts)}],
+        )
+
+        content = response.content[0].text
+        fenced = _FENCE_RE.match(content)
+        content = fenced.group(1) if fenced else content.strip()
+
+        data = orjson.loads(content)
+        if not isinstance(data, list) or len(data) != len(batch):
+            raise ValueError(
+                f"expected {len(batch)} analyses, got {type(data).__name__} "
+                f"of length {len(data) if isinstance(data, list) else 'n/a'}"
+            )
+        return [MessageAnalysis.model_validate(item) for item in data]
+
 
 class LLMService:
     """Service for LLM-based intent parsing and extraction."""
 
     def __init__(self, api_key: str, max_retries: int = 3):
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Async client so Claude round-trips (often seconds) don't stall
+        # the event loop; pooled connections cover many concurrent chats.
+        # DefaultAsyncHttpxClient rather than a bare httpx.AsyncClient:
+        # it's whatever client type the installed SDK line expects, and
+        # keeps the SDK's own timeout/retry transport defaults
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            ),
+        )
         self.max_retries = max_retries
+        self._answer_cache: OrderedDict[bytes, str] = OrderedDict()
+        # Deferred import: semantic_cache imports our models at module load
+        from services.semantic_cache import SemanticCache
+        self._analysis_cache = SemanticCache()
+        self._exact_cache = AsyncTTLCache(ttl=ANALYSIS_CACHE_TTL, max_size=ANALYSIS_CACHE_SIZE)
+        self._batcher = _BatchAnalyzer(self)
+        self._rpm_limiter = AsyncRateLimiter(REQUESTS_PER_MINUTE)
+        self._tpm_limiter = AsyncRateLimiter(INPUT_TOKENS_PER_MINUTE)
+        self._concurrency = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def close(self) -> None:
+        """Stop the batch worker and close the underlying HTTP client."""
+        await self._batcher.close()
+        await self.client.close()
+
+    async def _create(self, **kwargs) -> anthropic.types.Message:
+        """messages.create behind the client-side throttle.
+
+        Every Claude call takes its estimated input tokens from the
+        tokens-per-minute bucket, a token from the requests-per-minute
+        bucket, and a concurrency slot. Rate-limit responses back off
+        exponentially with jitter, honoring retry-after when present.
+        """
+        estimate = min(_estimated_input_tokens(kwargs), INPUT_TOKENS_PER_MINUTE)
+        delay = 1.0
+        for attempt in range(self.max_retries):
+            try:
+                await self._tpm_limiter.acquire(estimate)
+                async with self._rpm_limiter:
+                    async with self._concurrency:
+                        return await self.client.messages.create(**kwargs)
+            except anthropic.RateLimitError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                retry_after = e.response.headers.get("retry-after")
+                wait = float(retry_after) if retry_after else delay * (1 + random.random())
+                logger.warning(f"Rate limited (attempt {attempt + 1}); retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+                delay *= 2
 
     async def analyze_message(
         self,
@@ -139,64 +495,98 @@ class LLMService:
         Returns:
             MessageAnalysis with intent and extracted data
         """
-        messages = []
-
-        # Add context messages if provided
-        if context:
-            for msg in context[-5:]:  # Last 5 messages
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
+        # Trivial greetings and "what should we eat" have finite trigger
+        # sets; classify them locally and skip the API entirely
+        fast = _fast_intent(text)
+        if fast is not None:
+            return fast
+
+        messages = self._build_messages(text, context)
+
+        # Exact-match fast path: same payload, same (still-valid) answer.
+        # Keyed over everything that shapes the request so a model or
+        # prompt change naturally misses.
+        exact_key = hashlib.blake2b(
+            orjson.dumps(
+                {"model": MODEL, "system": SYSTEM_PROMPT, "messages": messages, "max_tokens": 1024},
+                option=orjson.OPT_SORT_KEYS,
+            ),
+            digest_size=16,
+        ).digest()
+        cached_payload = self._exact_cache.get(exact_key)
+        if cached_payload is not None:
+            return MessageAnalysis.model_validate_json(cached_payload)
+
+        # Near-duplicate phrasings skip the Claude round-trip; hits on
+        # context-bound entries require the same conversation state
+        cached = self._analysis_cache.get(text, context)
+        if cached is not None:
+            return cached
+
+        # Concurrent arrivals share one Claude call where possible
+        analysis = await self._batcher.analyze(text, context)
+
+        # Error fallbacks (confidence 0.0) aren't worth remembering.
+        # Both caches hold serialized JSON and rehydrate per hit, so a
+        # handler mutating its analysis can't corrupt later hits.
+        if analysis.confidence > 0.0 or analysis.intent is not Intent.UNKNOWN:
+            self._exact_cache.set(exact_key, analysis.model_dump_json())
+            self._analysis_cache.put(text, analysis, context)
+        return analysis
+
+    @staticmethod
+    def _build_messages(text: str, context: Optional[list[dict]]) -> list[dict]:
+        """Assemble the messages payload for a single analysis call.
+
+        Prior turns are kept newest-first up to CONTEXT_TOKEN_BUDGET
+        estimated tokens rather than a fixed message count, so a few
+        verbose turns can't balloon input tokens while terse ones still
+        fill the window.
+        """
+        current = {"role": "user", "content": f"Analyze this message: {text}"}
+        if not context:
+            return [current]
 
-        # Add the current message
-        messages.append({
-            "role": "user",
-            "content": f"Analyze this message: {text}"
-        })
+        budget = CONTEXT_TOKEN_BUDGET
+        messages = []
+        for msg in reversed(context):
+            budget -= _estimate_tokens(msg["content"])
+            if budget < 0:
+                break
+            messages.append({"role": msg["role"], "content": msg["content"]})
+        messages.reverse()
+        messages.append(current)
+        return messages
+
+    async def _analyze_direct(
+        self,
+        text: str,
+        context: Optional[list[dict]] = None,
+    ) -> MessageAnalysis:
+        """Run a single-message analysis call with retries."""
+        messages = self._build_messages(text, context)
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
+                response = await self._create(
+                    model=MODEL,
                     max_tokens=1024,
-                    system=SYSTEM_PROMPT,
+                    system=_SYSTEM_BLOCKS,
                     messages=messages,
                 )
 
-                # Parse the JSON response
+                # Parse the JSON response, unwrapping a markdown fence if
+                # the model added one
                 content = response.content[0].text
-                # Clean up potential markdown code blocks
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                content = content.strip()
-
-                data = json.loads(content)
-
-                # Normalize log_entry data if present
-                if data.get("log_entry"):
-                    data["log_entry"] = self._normalize_log_entry(data["log_entry"])
-
-                # Normalize details data if present
-                if data.get("details"):
-                    data["details"] = self._normalize_details(data["details"])
-
-                # Convert to Pydantic model
-                analysis = MessageAnalysis(
-                    intent=Intent(data.get("intent", "unknown")),
-                    confidence=data.get("confidence", 1.0),
-                    log_entry=ParsedLogEntry(**data["log_entry"]) if data.get("log_entry") else None,
-                    details=ParsedDetails(**data["details"]) if data.get("details") else None,
-                    query=ParsedQuery(**data["query"]) if data.get("query") else None,
-                    clarification_needed=data.get("clarification_needed"),
-                )
+                fenced = _FENCE_RE.match(content)
+                content = fenced.group(1) if fenced else content.strip()
 
-                return analysis
+                # Single-pass parse + validation; the nested models
+                # normalize LLM quirks in their before-validators
+                return MessageAnalysis.model_validate_json(content)
 
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM response as JSON (attempt {attempt + 1}): {e}")
+            except (json.JSONDecodeError, ValidationError) as e:
+                logger.warning(f"Failed to parse LLM response (attempt {attempt + 1}): {e}")
                 if attempt == self.max_retries - 1:
                     return MessageAnalysis(
                         intent=Intent.UNKNOWN,
@@ -223,61 +613,11 @@ class LLMService:
             clarification_needed="Unable to process message."
         )
 
-    def _normalize_log_entry(self, data: dict) -> dict:
-        """Normalize log entry data to handle LLM inconsistencies."""
-        # Handle sentiment - LLM sometimes returns a float instead of string
-        if "sentiment" in data:
-            sentiment = data["sentiment"]
-            if isinstance(sentiment, (int, float)):
-                # Convert numeric sentiment to string
-                if sentiment >= 0.5:
-                    data["sentiment"] = "positive"
-                elif sentiment <= -0.5:
-                    data["sentiment"] = "negative"
-                elif -0.2 <= sentiment <= 0.2:
-                    data["sentiment"] = "neutral"
-                else:
-                    data["sentiment"] = "mixed"
-                # Use the original value as sentiment_score if not set
-                if "sentiment_score" not in data or data["sentiment_score"] is None:
-                    data["sentiment_score"] = float(sentiment)
-            elif sentiment not in ("positive", "negative", "neutral", "mixed"):
-                data["sentiment"] = "neutral"
-
-        # Ensure tags is a list
-        if "tags" in data and data["tags"] is None:
-            data["tags"] = []
-
-        return data
-
-    def _normalize_details(self, data: dict) -> dict:
-        """Normalize details data to handle LLM inconsistencies."""
-        # Handle sentiment same as log entry
-        if "sentiment" in data and data["sentiment"] is not None:
-            sentiment = data["sentiment"]
-            if isinstance(sentiment, (int, float)):
-                if sentiment >= 0.5:
-                    data["sentiment"] = "positive"
-                elif sentiment <= -0.5:
-                    data["sentiment"] = "negative"
-                elif -0.2 <= sentiment <= 0.2:
-                    data["sentiment"] = "neutral"
-                else:
-                    data["sentiment"] = "mixed"
-                if "sentiment_score" not in data or data["sentiment_score"] is None:
-                    data["sentiment_score"] = float(sentiment)
-
-        # Ensure tags is a list
-        if "tags" in data and data["tags"] is None:
-            data["tags"] = []
-
-        return data
-
     async def generate_response(self, prompt: str) -> str:
         """Generate a natural language response."""
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+            response = await self._create(
+                model=MODEL,
                 max_tokens=256,
                 messages=[{"role": "user", "content": prompt}],
             )
@@ -286,27 +626,33 @@ class LLMService:
             logger.error(f"Error generating response: {e}")
             return "I'm having trouble responding right now."
 
-    async def answer_query(self, question: str, data_context: str) -> str:
-        """Answer a user's question based on their food data.
+    async def stream_answer(self, question: str, data_context: str, cache_version: int = 0):
+        """Stream the answer to a user's question as text deltas.
+
+        Yields partial text as the model generates it, so callers can
+        show the first sentence while the rest is still being written.
+        Identical (question, data_context) pairs are answered from an
+        exact-match cache - in one piece - as long as cache_version is
+        unchanged; callers pass the database's write-version counter so
+        answers are never served against stale data.
 
         Args:
             question: The user's original question
             data_context: Formatted data from the database
+            cache_version: Monotonic counter that invalidates cached answers
 
-        Returns:
-            Natural language response answering the question
+        Yields:
+            Chunks of the natural language answer, in order
         """
-        system = """You are a helpful assistant for a food/restaurant logging bot.
-The user is asking a question about their saved restaurant experiences.
+        cache_key = hashlib.blake2b(
+            f"{question}\x00{data_context}\x00{cache_version}".encode(),
+            digest_size=16,
+        ).digest()
 
-Based on the data provided, give a friendly, conversational response that directly answers their question.
-- Be concise but helpful
-- If they ask about their "usual" or "go-to" order, look for patterns in what they've ordered
-- If they ask about recommendations, consider sentiment and frequency
-- Include specific dish names when relevant
-- If there's an exact_order saved, mention that's their saved order
-- If the data doesn't have enough info to answer, say so honestly
-- Keep response under 3-4 sentences unless more detail is needed"""
+        if cache_key in self._answer_cache:
+            self._answer_cache.move_to_end(cache_key)
+            yield self._answer_cache[cache_key]
+            return
 
         prompt = f"""User's question: {question}
 
@@ -316,14 +662,45 @@ Here's the relevant data from their food log:
 
 Please answer their question based on this data."""
 
+        request = dict(
+            model=MODEL,
+            max_tokens=512,
+            system=_ANSWER_SYSTEM_BLOCKS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        parts: list[str] = []
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=512,
-                system=system,
-                messages=[{"role": "user", "content": prompt}],
+            # Streaming still counts as one request against the throttle;
+            # the concurrency slot is held for the life of the stream
+            await self._tpm_limiter.acquire(
+                min(_estimated_input_tokens(request), INPUT_TOKENS_PER_MINUTE)
             )
-            return response.content[0].text
+            async with self._rpm_limiter:
+                async with self._concurrency:
+                    async with self.client.messages.stream(**request) as stream:
+                        async for text in stream.text_stream:
+                            parts.append(text)
+                            yield text
         except Exception as e:
             logger.error(f"Error answering query: {e}")
-            return "I'm having trouble looking that up right now."
+            # Whatever streamed before the failure stands; only a stream
+            # that produced nothing gets the apology
+            if not parts:
+                yield "I'm having trouble looking that up right now."
+            return
+
+        self._answer_cache[cache_key] = "".join(parts)
+        while len(self._answer_cache) > ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
+
+    async def answer_query(self, question: str, data_context: str, cache_version: int = 0) -> str:
+        """Answer a user's question based on their food data.
+
+        Buffered counterpart to stream_answer for callers that only want
+        the final text.
+        """
+        return "".join([
+            chunk
+            async for chunk in self.stream_answer(question, data_context, cache_version)
+        ])
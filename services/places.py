@@ -2,11 +2,20 @@
 
 import logging
 from typing import Optional
-from dataclasses import dataclass
 import httpx
+import orjson
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator
+
+from services.cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Place data is stable on the order of days; cache lookups accordingly.
+# Misses expire sooner: they may be typos, transient API failures, or
+# places Google simply hasn't indexed yet.
+SEARCH_CACHE_TTL = 24 * 3600
+NEGATIVE_CACHE_TTL = 3600
+
 # Mapping from Google Place types to cuisine names
 TYPE_TO_CUISINE = {
     "thai_restaurant": "Thai",
@@ -46,21 +55,69 @@ TYPE_TO_CUISINE = {
     "vegetarian_restaurant": "Vegetarian",
 }
 
+# Generic food-establishment types that don't imply a specific cuisine
+_FOOD_TYPES = frozenset({"restaurant", "food"})
+
+# Google returns price levels as enum strings; map them to 0-4
+_PRICE_LEVELS = {
+    "PRICE_LEVEL_FREE": 0,
+    "PRICE_LEVEL_INEXPENSIVE": 1,
+    "PRICE_LEVEL_MODERATE": 2,
+    "PRICE_LEVEL_EXPENSIVE": 3,
+    "PRICE_LEVEL_VERY_EXPENSIVE": 4,
+}
+
+
+def _extract_cuisine(types: list[str]) -> Optional[str]:
+    """Extract cuisine type from Google Place types."""
+    cuisine = next((TYPE_TO_CUISINE[t] for t in types if t in TYPE_TO_CUISINE), None)
+    if cuisine is not None:
+        return cuisine
+
+    # Default to "Restaurant" if it's a food establishment but no specific type
+    if not _FOOD_TYPES.isdisjoint(types):
+        return "Restaurant"
+
+    return None
+
+
+class PlaceData(BaseModel):
+    """Restaurant data from Google Places.
+
+    Validation aliases mirror the nested Places response shape, so a raw
+    place dict from the API validates directly - one pass through
+    pydantic's compiled core instead of a chain of .get() lookups.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
 
-@dataclass
-class PlaceData:
-    """Restaurant data from Google Places."""
-    place_id: str
-    name: str
-    address: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-    cuisine: Optional[str] = None
-    price_level: Optional[int] = None
-    dine_in: bool = True
+    place_id: str = Field(default="", validation_alias="id")
+    name: str = Field(default="", validation_alias=AliasPath("displayName", "text"))
+    address: Optional[str] = Field(default=None, validation_alias="formattedAddress")
+    latitude: Optional[float] = Field(default=None, validation_alias=AliasPath("location", "latitude"))
+    longitude: Optional[float] = Field(default=None, validation_alias=AliasPath("location", "longitude"))
+    cuisine: Optional[str] = Field(default=None, validation_alias="types")
+    price_level: Optional[int] = Field(default=None, validation_alias="priceLevel")
+    dine_in: bool = Field(default=True, validation_alias="dineIn")
     takeout: bool = False
     delivery: bool = False
 
+    @field_validator("cuisine", mode="before")
+    @classmethod
+    def _cuisine_from_types(cls, value):
+        """Derive the cuisine label when given a raw place types list."""
+        if isinstance(value, list):
+            return _extract_cuisine(value)
+        return value
+
+    @field_validator("price_level", mode="before")
+    @classmethod
+    def _price_level_from_enum(cls, value):
+        """Map Google's PRICE_LEVEL_* enum string to its 0-4 integer."""
+        if isinstance(value, str):
+            return _PRICE_LEVELS.get(value)
+        return value
+
 
 class PlacesService:
     """Google Places API integration."""
@@ -70,6 +127,19 @@ class PlacesService:
     def __init__(self, api_key: str, default_location: str = "Orange County, CA"):
         self.api_key = api_key
         self.default_location = default_location
+        self._search_cache = AsyncTTLCache(
+            ttl=SEARCH_CACHE_TTL, max_size=2048, none_ttl=NEGATIVE_CACHE_TTL
+        )
+        # One keep-alive pool for all lookups - a per-call client paid the
+        # TCP+TLS handshake to Google on every search
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._client.aclose()
 
     async def search_restaurant(
         self,
@@ -78,6 +148,12 @@ class PlacesService:
     ) -> Optional[PlaceData]:
         """Search for a restaurant by name and optional location.
 
+        Results are cached for 24 hours (misses for 1 hour) keyed on the
+        normalized name and location, so repeated logs at the same place
+        don't re-hit the billed, rate-limited Places API. Concurrent
+        lookups for the same key wait on the cache's per-key lock and
+        share a single outbound request.
+
         Args:
             name: Restaurant name to search for
             location_hint: Optional location to narrow search
@@ -86,6 +162,14 @@ class PlacesService:
             PlaceData if found, None otherwise
         """
         location = location_hint or self.default_location
+        cache_key = f"{name.strip().lower()}|{location.strip().lower()}"
+        return await self._search_cache.get_or_fetch(
+            cache_key,
+            lambda: self._search_uncached(name, location),
+        )
+
+    async def _search_uncached(self, name: str, location: str) -> Optional[PlaceData]:
+        """Perform the actual Places API text search."""
         query = f"{name} restaurant {location}"
 
         headers = {
@@ -100,27 +184,26 @@ class PlacesService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=body,
-                    timeout=10.0,
-                )
+            response = await self._client.post(
+                self.BASE_URL,
+                headers=headers,
+                json=body,
+            )
 
-                if response.status_code != 200:
-                    logger.warning(f"Places API returned status {response.status_code}: {response.text}")
-                    return None
+            if response.status_code != 200:
+                logger.warning(f"Places API returned status {response.status_code}: {response.text}")
+                return None
 
-                data = response.json()
-                places = data.get("places", [])
+            # orjson parses the nested place payload a few times faster
+            # than the stdlib decoder response.json() would use
+            data = orjson.loads(response.content)
+            places = data.get("places", [])
 
-                if not places:
-                    logger.info(f"No places found for query: {query}")
-                    return None
+            if not places:
+                logger.info(f"No places found for query: {query}")
+                return None
 
-                place = places[0]
-                return self._parse_place(place)
+            return PlaceData.model_validate(places[0])
 
         except httpx.TimeoutException:
             logger.warning(f"Timeout searching for restaurant: {name}")
@@ -132,61 +215,3 @@ class PlacesService:
             logger.error(f"Unexpected error searching for restaurant: {e}")
             return None
 
-    def _parse_place(self, place: dict) -> PlaceData:
-        """Parse a Google Places API response into PlaceData."""
-        place_id = place.get("id", "")
-        name = place.get("displayName", {}).get("text", "")
-        address = place.get("formattedAddress")
-
-        location = place.get("location", {})
-        latitude = location.get("latitude")
-        longitude = location.get("longitude")
-
-        # Extract cuisine from place types
-        types = place.get("types", [])
-        cuisine = self._extract_cuisine(types)
-
-        # Parse price level (Google returns as string like "PRICE_LEVEL_MODERATE")
-        price_level_str = place.get("priceLevel", "")
-        price_level = self._parse_price_level(price_level_str)
-
-        # Service options
-        dine_in = place.get("dineIn", True)
-        takeout = place.get("takeout", False)
-        delivery = place.get("delivery", False)
-
-        return PlaceData(
-            place_id=place_id,
-            name=name,
-            address=address,
-            latitude=latitude,
-            longitude=longitude,
-            cuisine=cuisine,
-            price_level=price_level,
-            dine_in=dine_in,
-            takeout=takeout,
-            delivery=delivery,
-        )
-
-    def _extract_cuisine(self, types: list[str]) -> Optional[str]:
-        """Extract cuisine type from Google Place types."""
-        for place_type in types:
-            if place_type in TYPE_TO_CUISINE:
-                return TYPE_TO_CUISINE[place_type]
-
-        # Default to "Restaurant" if it's a food establishment but no specific type
-        if "restaurant" in types or "food" in types:
-            return "Restaurant"
-
-        return None
-
-    def _parse_price_level(self, price_level_str: str) -> Optional[int]:
-        """Parse Google's price level string to integer."""
-        mapping = {
-            "PRICE_LEVEL_FREE": 0,
-            "PRICE_LEVEL_INEXPENSIVE": 1,
-            "PRICE_LEVEL_MODERATE": 2,
-            "PRICE_LEVEL_EXPENSIVE": 3,
-            "PRICE_LEVEL_VERY_EXPENSIVE": 4,
-        }
-        return mapping.get(price_level_str)
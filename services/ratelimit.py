@@ -0,0 +1,44 @@
+"""Client-side rate limiting for outbound API calls."""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter usable as an async context manager.
+
+    The bucket holds up to `rate` tokens and refills continuously over
+    `period` seconds. acquire() takes one token, sleeping until a token
+    is available, so callers stay under per-minute caps instead of
+    tripping 429s and paying the server-side retry tax.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, waiting for refill if needed."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * (self.rate / self.period),
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                # Sleep just long enough for the deficit to refill
+                await asyncio.sleep((tokens - self._tokens) * (self.period / self.rate))
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
@@ -0,0 +1,133 @@
+"""Similarity-based cache for LLM intent analysis results."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Optional
+
+from services.llm import Intent, MessageAnalysis
+
+logger = logging.getLogger(__name__)
+
+# Intents that mutate state (a cached hit would replay a stale write).
+_UNCACHEABLE_INTENTS = {Intent.LOG_ENTRY, Intent.ADD_DETAILS}
+
+# Marker for entries whose analysis doesn't depend on conversation state
+_CONTEXT_FREE = b""
+
+
+def _normalize(text: str) -> str:
+    """Normalize a message for similarity comparison."""
+    return " ".join(text.casefold().split())
+
+
+def _context_digest(context: Optional[list[dict]]) -> bytes:
+    """Digest the recent turns a context-sensitive analysis depends on."""
+    if not context:
+        return _CONTEXT_FREE
+    h = hashlib.blake2b(digest_size=8)
+    for msg in context[-5:]:
+        h.update(msg["role"].encode())
+        h.update(b"\x00")
+        h.update(msg["content"].encode())
+        h.update(b"\x01")
+    return h.digest()
+
+
+class SemanticCache:
+    """In-memory cache keyed on message similarity.
+
+    Near-duplicate phrasings ("what should we eat" vs "what should we eat
+    tonight") resolve to the same intent, so repeated messages can skip the
+    LLM round-trip entirely. Lookup compares the normalized message against
+    cached keys and returns the stored MessageAnalysis when the similarity
+    ratio meets the threshold. Entries are evicted LRU-style once the cache
+    is full.
+
+    Entries are stored as serialized JSON and rehydrated on every hit, so
+    each caller gets a fresh MessageAnalysis - mutations can't leak back
+    into the cache - and the value format would drop straight into a
+    bytes-native backend like Redis without pickle.
+
+    Stateful intents (LOG_ENTRY, ADD_DETAILS) are never cached since their
+    extracted data depends on the exact message and conversation state.
+    Confident analyses of the remaining intents are context-free and match
+    regardless of history; low-confidence results (clarifications) are
+    stored with a digest of the conversation turns that produced them and
+    only hit again in that exact conversational state.
+    """
+
+    def __init__(self, threshold: float = 0.9, max_size: int = 1000):
+        self.threshold = threshold
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+    def get(
+        self,
+        text: str,
+        context: Optional[list[dict]] = None,
+    ) -> Optional[MessageAnalysis]:
+        """Return a cached analysis for a similar message, or None."""
+        key = _normalize(text)
+        digest = None  # computed lazily, only for context-bound candidates
+
+        # Exact-match fast path
+        entry = self._entries.get(key)
+        if entry is not None:
+            payload, bound = entry
+            if bound == _CONTEXT_FREE or bound == (digest := _context_digest(context)):
+                self._entries.move_to_end(key)
+                return MessageAnalysis.model_validate_json(payload)
+
+        matcher = SequenceMatcher(a=key)
+        best_key = None
+        best_ratio = 0.0
+
+        for cached_key, (_, bound) in self._entries.items():
+            if bound != _CONTEXT_FREE:
+                if digest is None:
+                    digest = _context_digest(context)
+                if bound != digest:
+                    continue
+            matcher.set_seq2(cached_key)
+            # Cheap upper-bound checks before the full quadratic ratio
+            if matcher.real_quick_ratio() < self.threshold:
+                continue
+            if matcher.quick_ratio() < self.threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= self.threshold and ratio > best_ratio:
+                best_key = cached_key
+                best_ratio = ratio
+
+        if best_key is not None:
+            logger.debug(f"Semantic cache hit ({best_ratio:.2f}): {key!r} ~ {best_key!r}")
+            self._entries.move_to_end(best_key)
+            return MessageAnalysis.model_validate_json(self._entries[best_key][0])
+
+        return None
+
+    def put(
+        self,
+        text: str,
+        analysis: MessageAnalysis,
+        context: Optional[list[dict]] = None,
+    ) -> None:
+        """Cache an analysis result unless its intent is stateful."""
+        if analysis.intent in _UNCACHEABLE_INTENTS:
+            return
+
+        # Clarifications depend on the surrounding conversation - bind
+        # them to it so they never leak into an unrelated exchange
+        if analysis.clarification_needed or analysis.confidence < 0.5:
+            bound = _context_digest(context)
+        else:
+            bound = _CONTEXT_FREE
+
+        key = _normalize(text)
+        self._entries[key] = (analysis.model_dump_json(), bound)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)